@@ -21,19 +21,25 @@ import os
 # Suppress Qt geometry warnings - must be set before importing Qt
 os.environ['QT_LOGGING_RULES'] = 'qt.qpa.*=false'
 
+import importlib.util
 import sys
 import threading
 from typing import Optional, Dict
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QCheckBox
-from PyQt6.QtCore import QThread, QTimer, Qt
+from PyQt6.QtCore import QEvent, QThread, QTimer, Qt
 from PyQt6.QtGui import QGuiApplication
+import pyqtgraph as pg
 import serial
 
 # Import configuration constants
+from constants.plotting import (
+    PLOT_ANTIALIAS,
+    PLOT_USE_NUMBA_IF_AVAILABLE,
+    PLOT_USE_OPENGL_IF_AVAILABLE,
+)
 from constants.runtime import MAX_SWEEPS_IN_MEMORY
 from constants.ui import (
-    CONFIG_CHECK_INTERVAL,
     CONTROL_PANEL_STRETCH,
     FORCE_PLOT_DEBOUNCE_MS,
     HEATMAP_TAB_NAME,
@@ -43,6 +49,7 @@ from constants.ui import (
     PZT_RS_PZT_TAB_NAME,
     ROSETTE_TAB_NAME,
     SPECTRUM_UPDATE_INTERVAL_MS,
+    STATUS_LOG_FLUSH_INTERVAL_MS,
     STATUS_SEPARATOR_WIDTH,
     SPECTRUM_TAB_NAME,
     TIME_SERIES_TAB_NAME,
@@ -53,7 +60,7 @@ from constants.ui import (
     WINDOW_SCREEN_MARGIN_PX,
     WINDOW_WIDTH,
 )
-from constants.heatmap import HEATMAP_FPS
+from constants.heatmap import HEATMAP_UPDATE_INTERVAL_MS
 
 # Import mixin modules
 from serial_communication import ADCSerialMixin, ForceSerialMixin
@@ -169,12 +176,15 @@ class ADCStreamerGUI(
         self.processed_data_buffer = None
         self.sweep_timestamps_buffer = None
         self.samples_per_sweep = 0
+        # Sweep width pinned when a capture run starts; None means recompute.
+        self._capture_samples_per_sweep = None
         self.buffer_lock = threading.Lock()
         self._init_filter_state()
         self._init_pzt_ghost_removal_state()
         self._reset_capture_buffer_state()
         
         self.is_capturing = False
+        self._capture_stop_pending = False
         self.is_full_view = False
 
     def _init_archive_state(self):
@@ -205,6 +215,10 @@ class ADCStreamerGUI(
         self.device_mode = 'adc'
         self.adc_configuration_service = ADCConfigurationService(self.send_command_and_wait_ack)
         self.adc_configuration_runner = ADCConfigurationRunner(self.adc_configuration_service)
+        self.adc_configuration_runner.finished.connect(
+            self.on_configuration_finished,
+            Qt.ConnectionType.QueuedConnection,
+        )
 
         self.config = build_default_adc_config_state()
         
@@ -233,22 +247,26 @@ class ADCStreamerGUI(
         self._rosette_force_z_curve = None
         self.force_plot_debounce_ms = FORCE_PLOT_DEBOUNCE_MS
         self._serial_disconnect_in_progress = False
+        self._current_visualization_tab_name: Optional[str] = None
     
     def _init_timers(self):
         """Initialize Qt timers."""
         self.plot_update_timer = QTimer()
         self.plot_update_timer.setSingleShot(True)
+        # Redraw debounces tolerate a few ms of slack; coarse timers let Qt
+        # align their wakeups with other pending timer events.
+        self.plot_update_timer.setTimerType(Qt.TimerType.CoarseTimer)
         # Shared debounce for ADC-driven refreshes. When ADC buffers land we redraw
         # both the ADC traces and the force traces together so the views stay aligned.
-        self.plot_update_timer.timeout.connect(self.update_plot)
-        self.plot_update_timer.timeout.connect(self.update_force_plot)
+        self.plot_update_timer.timeout.connect(self._update_live_plots)
 
         self.force_plot_timer = QTimer()
         self.force_plot_timer.setSingleShot(True)
+        self.force_plot_timer.setTimerType(Qt.TimerType.CoarseTimer)
         # Separate debounce for force-only arrivals. Force samples can arrive between
         # ADC buffer updates, so this timer refreshes just the force plot without
         # waiting for the next ADC-driven redraw.
-        self.force_plot_timer.timeout.connect(self.update_force_plot)
+        self.force_plot_timer.timeout.connect(lambda: self._update_live_plots(include_adc=False))
 
         self.signal_integration_update_timer = QTimer()
         self.signal_integration_update_timer.setSingleShot(True)
@@ -257,16 +275,18 @@ class ADCStreamerGUI(
         self.heatmap_update_timer = QTimer()
         self.heatmap_update_timer.setSingleShot(True)
         self.heatmap_update_timer.timeout.connect(self.update_heatmap_plot)
-        
-        self.config_check_timer = QTimer()
-        self.config_check_timer.timeout.connect(self.check_config_completion)
-        self.config_check_timer.setInterval(CONFIG_CHECK_INTERVAL)
 
         # Spectrum update timer
         self.spectrum_timer = QTimer()
         self.spectrum_timer.timeout.connect(self.update_spectrum)
         self.spectrum_timer.setInterval(SPECTRUM_UPDATE_INTERVAL_MS)
 
+        # Status lines queue up and reach the log widget in one batch per tick.
+        self.status_log_flush_timer = QTimer()
+        self.status_log_flush_timer.setSingleShot(True)
+        self.status_log_flush_timer.setInterval(STATUS_LOG_FLUSH_INTERVAL_MS)
+        self.status_log_flush_timer.timeout.connect(self.flush_status_log)
+
     def _log_startup_message(self):
         """Log startup message to status window."""
         self.log_status("=" * STATUS_SEPARATOR_WIDTH)
@@ -303,6 +323,9 @@ class ADCStreamerGUI(
         self.statusBar().showMessage("Disconnected")
         
         self.visualization_tabs.currentChanged.connect(self.on_visualization_tab_changed)
+        # Tab switches from here on refresh the cached title; drop anything
+        # looked up while the panels were still being built.
+        self._current_visualization_tab_name = None
 
         self._fit_window_to_screen()
         QTimer.singleShot(0, self._fit_window_to_screen)
@@ -380,14 +403,40 @@ class ADCStreamerGUI(
         self.save_last_analysis_settings()
 
         if self.serial_port and self.serial_port.is_open:
-            self.disconnect_serial()
+            # Block until the archive writer has drained: the deferred cleanup
+            # path relies on Qt timers that never fire once the app exits.
+            self.disconnect_serial(cleanup_block=True)
         if self.force_serial_port and self.force_serial_port.is_open:
             self.disconnect_force_serial()
 
         self.shutdown_filter_worker()
         self.shutdown_spectrum_worker()
+        # The batched log timer will not fire again; write out the last lines.
+        self.flush_status_log()
 
         event.accept()
+
+    def changeEvent(self, event):
+        """Redraw the live plots when the window comes back from being minimized."""
+        super().changeEvent(event)
+        if event.type() != QEvent.Type.WindowStateChange or self.isMinimized():
+            return
+        if not self.should_update_live_timeseries_display():
+            return
+        # Redraws were skipped while minimized, so refresh from the buffers now.
+        self.trigger_plot_update()
+
+    def _update_live_plots(self, include_adc: bool = True):
+        """Redraw the live plots from a debounce timer, skipping while nothing is on screen."""
+        if not self.is_plot_window_exposed():
+            return
+        if include_adc:
+            self.update_plot()
+        self.update_force_plot()
+
+    def is_plot_window_exposed(self) -> bool:
+        """Return True when the main window is shown and not minimized."""
+        return self.isVisible() and not self.isMinimized()
     
     # ========================================================================
     # Visualization Tab Logic
@@ -395,7 +444,8 @@ class ADCStreamerGUI(
     
     def on_visualization_tab_changed(self, index):
         """Handle tab changes for time-series and spectrum refresh behavior."""
-        current_tab = self.visualization_tabs.tabText(index)
+        current_tab = self.visualization_tabs.tabText(index) if index >= 0 else ""
+        self._current_visualization_tab_name = current_tab
 
         if current_tab == SPECTRUM_TAB_NAME:
             self.start_spectrum_updates()
@@ -411,8 +461,8 @@ class ADCStreamerGUI(
                 and hasattr(self, 'prepare_timeseries_filter_resume')
             ):
                 self.prepare_timeseries_filter_resume()
+            # The debounced redraw refreshes the force overlay as well.
             self.trigger_plot_update()
-            self.update_force_plot()
 
         if current_tab == PRESSURE_MAP_TAB_NAME:
             self.update_signal_integration_plot()
@@ -427,13 +477,22 @@ class ADCStreamerGUI(
                 self.refresh_analysis_plot()
 
     def get_current_visualization_tab_name(self) -> str:
-        """Return the current visualization tab title."""
+        """Return the current visualization tab title.
+
+        The title is cached until the next tab switch or title change, since
+        the live redraw paths ask for it on every timer tick.
+        """
+        cached_name = getattr(self, "_current_visualization_tab_name", None)
+        if cached_name is not None:
+            return cached_name
         if not hasattr(self, "visualization_tabs") or self.visualization_tabs is None:
             return ""
         current_index = self.visualization_tabs.currentIndex()
         if current_index < 0:
             return ""
-        return self.visualization_tabs.tabText(current_index)
+        current_name = self.visualization_tabs.tabText(current_index)
+        self._current_visualization_tab_name = current_name
+        return current_name
 
     def should_store_capture_data(self) -> bool:
         """Return True when capture should persist/archive time-series data."""
@@ -475,9 +534,8 @@ class ADCStreamerGUI(
             return
         if getattr(self, "_heatmap_updating_plot", False):
             return
-        interval_ms = max(1, int(1000 / max(1, HEATMAP_FPS)))
         if not self.heatmap_update_timer.isActive():
-            self.heatmap_update_timer.start(interval_ms)
+            self.heatmap_update_timer.start(HEATMAP_UPDATE_INTERVAL_MS)
 
     def start_spectrum_updates(self):
         """Start spectrum updates."""
@@ -496,6 +554,12 @@ def main():
     """Main application entry point."""
     app = QApplication(sys.argv)
     app.setStyle('Fusion')  # Modern look across platforms
+    # Must be set before any PlotWidget is created.
+    pg.setConfigOptions(
+        antialias=PLOT_ANTIALIAS,
+        useOpenGL=PLOT_USE_OPENGL_IF_AVAILABLE and importlib.util.find_spec("OpenGL") is not None,
+        useNumba=PLOT_USE_NUMBA_IF_AVAILABLE and importlib.util.find_spec("numba") is not None,
+    )
 
     window = ADCStreamerGUI()
     window.show()
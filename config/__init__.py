@@ -29,6 +29,7 @@ from .config_view_state import (
 )
 from .config_snapshot import (
     ADCConfigurationSnapshot,
+    VREF_COMMAND_TO_VOLTS,
     VREF_LABEL_TO_COMMAND,
     build_adc_configuration_snapshot,
     normalize_gain,
@@ -59,6 +60,7 @@ __all__ = [
     'build_start_ready_state',
     'build_start_unavailable_state',
     'ADCConfigurationSnapshot',
+    'VREF_COMMAND_TO_VOLTS',
     'VREF_LABEL_TO_COMMAND',
     'build_adc_configuration_snapshot',
     'normalize_gain',
@@ -2,6 +2,7 @@
 ADC Configuration Runner
 ========================
 Runs ADC configuration retries on a background thread without touching GUI widgets.
+The finished outcome is delivered through the ``finished`` signal.
 """
 
 from __future__ import annotations
@@ -10,6 +11,10 @@ import threading
 import time
 from dataclasses import dataclass
 
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from serial_communication.adc_session import retry_backoff_delay
+
 
 @dataclass(slots=True)
 class ADCConfigurationRunOutcome:
@@ -21,21 +26,23 @@ class ADCConfigurationRunOutcome:
         return bool(self.result and getattr(self.result, "success", False))
 
 
-class ADCConfigurationRunner:
+class ADCConfigurationRunner(QObject):
     """Own the background worker for ADC configuration attempts."""
 
+    # Emitted from the worker thread with the ADCConfigurationRunOutcome.
+    finished = pyqtSignal(object)
+
     def __init__(self, configuration_service):
+        super().__init__()
         self.configuration_service = configuration_service
         self._lock = threading.Lock()
         self._running = False
-        self._completed_outcome: ADCConfigurationRunOutcome | None = None
 
     def start(self, serial_port, request, *, max_attempts: int = 3):
         with self._lock:
             if self._running:
                 return False
             self._running = True
-            self._completed_outcome = None
 
         def worker():
             outcome = ADCConfigurationRunOutcome(result=None)
@@ -47,30 +54,22 @@ class ADCConfigurationRunner:
                 serial_port.reset_output_buffer()
                 time.sleep(0.05)
 
-                for _attempt in range(max_attempts):
+                for attempt in range(max_attempts):
                     result = self.configuration_service.send_config_with_verification(request)
                     outcome = ADCConfigurationRunOutcome(result=result)
                     if result.success:
                         break
-                    time.sleep(0.05)
+                    time.sleep(retry_backoff_delay(attempt + 1))
             except Exception as exc:
                 outcome = ADCConfigurationRunOutcome(result=None, error_message=f"Configuration error: {exc}")
             finally:
                 with self._lock:
-                    self._completed_outcome = outcome
                     self._running = False
+                self.finished.emit(outcome)
 
         threading.Thread(target=worker, daemon=True).start()
         return True
 
-    def take_outcome(self) -> ADCConfigurationRunOutcome | None:
-        with self._lock:
-            if self._running or self._completed_outcome is None:
-                return None
-            outcome = self._completed_outcome
-            self._completed_outcome = None
-            return outcome
-
     @property
     def is_running(self) -> bool:
         with self._lock:
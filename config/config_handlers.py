@@ -18,7 +18,7 @@ from config.config_view_state import (
     build_start_ready_state,
     build_start_unavailable_state,
 )
-from config.config_snapshot import VREF_LABEL_TO_COMMAND, build_adc_configuration_snapshot
+from config.config_snapshot import VREF_COMMAND_TO_VOLTS, VREF_LABEL_TO_COMMAND, build_adc_configuration_snapshot
 from config.mcu_profile import resolve_mcu_profile
 from constants.serial import DEFAULT_CONFIG_BUFFER_SIZE, MAX_SAMPLES_BUFFER
 from constants.defaults_555 import (
@@ -45,17 +45,7 @@ class ConfigurationMixin:
 
     def get_vref_voltage(self) -> float:
         """Get the numeric voltage reference value for the current configuration."""
-        vref_str = self.config['reference']
-
-        if vref_str == "1.2":
-            return 1.2
-        if vref_str == "3.3" or vref_str == "vdd":
-            return 3.3
-        if vref_str == "0.8vdd":
-            return 3.3 * 0.8
-        if vref_str == "ext":
-            return 1.25
-        return 3.3
+        return VREF_COMMAND_TO_VOLTS.get(self.config['reference'], 3.3)
 
     def get_estimated_555_pair_timeout_ms(self) -> int:
         return self.adc_configuration_service.estimate_555_pair_timeout_ms(
@@ -1194,29 +1184,20 @@ class ConfigurationMixin:
         self.timing_state.arduino_sample_times.clear()
         self.timing_state.buffer_gap_times.clear()
 
-        self.config_check_timer.start()
-
         try:
             request = self._build_adc_configuration_request()
         except ValueError as exc:
-            self.config_check_timer.stop()
             self.log_status(f"ERROR: {exc}")
             self._apply_configure_button_state(build_configuration_failed_state())
             return
 
         started = self.adc_configuration_runner.start(self.serial_port, request, max_attempts=3)
         if not started:
-            self.config_check_timer.stop()
             self.log_status("Configuration already in progress")
             self._apply_configure_button_state(build_configuration_failed_state())
     
-    def check_config_completion(self):
-        """Check if configuration has completed (called by timer)."""
-        outcome = self.adc_configuration_runner.take_outcome()
-        if outcome is None:
-            return
-
-        self.config_check_timer.stop()
+    def on_configuration_finished(self, outcome):
+        """Apply a finished configuration run (queued from the runner thread)."""
         if outcome.error_message:
             self.log_status(outcome.error_message)
         if outcome.result is not None:
@@ -1308,7 +1289,36 @@ class ConfigurationMixin:
             self.force_z_checkbox.setChecked(checked)
 
     def update_channel_list(self):
-        """Update the channel selector checkboxes based on configured channels."""
+        """Update the channel selector checkboxes based on configured channels.
+
+        The checkboxes are only rebuilt when their labels or the force overlay
+        change, so repeated calls for an unchanged sequence (every keystroke in
+        the channels field) keep the existing widgets and their check state.
+        """
+        self._invalidate_selected_plot_channels()
+        display_specs = self.get_display_channel_specs() if self.config['channels'] else []
+        layout_key = (
+            tuple((spec['key'], spec['label']) for spec in display_specs),
+            self._should_show_force_channel_checkboxes(),
+        )
+        if layout_key != getattr(self, '_channel_checkbox_layout_key', None):
+            self._channel_checkbox_layout_key = layout_key
+            self._rebuild_channel_checkboxes(display_specs)
+
+        if not self.config['channels']:
+            if hasattr(self, "update_pressure_map_timeline_controls"):
+                self.update_pressure_map_timeline_controls()
+            self.update_rosette_channel_list()
+            return
+
+        if hasattr(self, "update_pressure_map_timeline_controls"):
+            self.update_pressure_map_timeline_controls()
+        if hasattr(self, "refresh_spectrum_package_options"):
+            self.refresh_spectrum_package_options()
+        self.update_rosette_channel_list()
+
+    def _rebuild_channel_checkboxes(self, display_specs):
+        """Replace the channel and force overlay checkboxes with fresh widgets."""
         # Clear existing checkboxes
         for checkbox in self.channel_checkboxes.values():
             checkbox.deleteLater()
@@ -1321,19 +1331,15 @@ class ConfigurationMixin:
                 item.widget().deleteLater()
         self._reset_force_channel_checkbox_refs()
 
-        if not self.config['channels']:
-            if hasattr(self, "update_pressure_map_timeline_controls"):
-                self.update_pressure_map_timeline_controls()
-            self.update_rosette_channel_list()
+        if not display_specs:
             return
 
-        display_specs = self.get_display_channel_specs()
-
         # Create checkboxes in a compact grid
         for idx, spec in enumerate(display_specs):
             from PyQt6.QtWidgets import QCheckBox
             checkbox = QCheckBox(spec['label'])
             checkbox.setChecked(True)  # Select all by default
+            checkbox.stateChanged.connect(self._invalidate_selected_plot_channels)
             checkbox.stateChanged.connect(self.trigger_plot_update)
 
             row = idx // MAX_PLOT_COLUMNS
@@ -1343,11 +1349,6 @@ class ConfigurationMixin:
             self.channel_checkboxes[spec['key']] = checkbox
 
         self._add_force_channel_checkboxes(start_index=len(display_specs))
-        if hasattr(self, "update_pressure_map_timeline_controls"):
-            self.update_pressure_map_timeline_controls()
-        if hasattr(self, "refresh_spectrum_package_options"):
-            self.refresh_spectrum_package_options()
-        self.update_rosette_channel_list()
 
     def update_rosette_channel_list(self):
         """Update Rosette selector checkboxes for PZT_RS mode."""
@@ -1360,6 +1361,7 @@ class ConfigurationMixin:
             key: checkbox.isChecked()
             for key, checkbox in getattr(self, 'rosette_channel_checkboxes', {}).items()
         }
+        self._invalidate_selected_plot_channels()
         for checkbox in getattr(self, 'rosette_channel_checkboxes', {}).values():
             checkbox.deleteLater()
         self.rosette_channel_checkboxes.clear()
@@ -1377,6 +1379,7 @@ class ConfigurationMixin:
             from PyQt6.QtWidgets import QCheckBox
             checkbox = QCheckBox(spec['label'])
             checkbox.setChecked(previous_state.get(spec['key'], True))
+            checkbox.stateChanged.connect(self._invalidate_selected_plot_channels)
             checkbox.stateChanged.connect(self.trigger_plot_update)
 
             row = idx // MAX_PLOT_COLUMNS
@@ -1384,36 +1387,56 @@ class ConfigurationMixin:
             self.rosette_channel_checkboxes_layout.addWidget(checkbox, row, col)
             self.rosette_channel_checkboxes[spec['key']] = checkbox
 
+    def _set_plot_checkboxes_checked(self, checkboxes, checked: bool):
+        """Toggle a group of plot checkboxes and refresh the selection once.
+
+        Each checkbox's stateChanged would otherwise invalidate the selection
+        cache and re-arm the plot debounce individually.
+        """
+        widgets = [checkbox for checkbox in checkboxes if checkbox is not None]
+        previous_states = [checkbox.blockSignals(True) for checkbox in widgets]
+        try:
+            for checkbox in widgets:
+                checkbox.setChecked(checked)
+        finally:
+            for checkbox, previous_state in zip(widgets, previous_states):
+                checkbox.blockSignals(previous_state)
+        self._invalidate_selected_plot_channels()
+        self.trigger_plot_update()
+
+    def _main_plot_checkboxes(self):
+        """Return ADC channel checkboxes followed by the force overlay toggles."""
+        return [*self.channel_checkboxes.values(), self.force_x_checkbox, self.force_z_checkbox]
+
     def select_all_channels(self):
         """Select all channel checkboxes."""
-        for checkbox in self.channel_checkboxes.values():
-            checkbox.setChecked(True)
-        self._set_force_channel_checkboxes_checked(True)
+        self._set_plot_checkboxes_checked(self._main_plot_checkboxes(), True)
 
     def deselect_all_channels(self):
         """Deselect all channel checkboxes."""
-        for checkbox in self.channel_checkboxes.values():
-            checkbox.setChecked(False)
-        self._set_force_channel_checkboxes_checked(False)
+        self._set_plot_checkboxes_checked(self._main_plot_checkboxes(), False)
 
     def select_all_rosette_channels(self):
         """Select all Rosette channel checkboxes."""
-        for checkbox in getattr(self, 'rosette_channel_checkboxes', {}).values():
-            checkbox.setChecked(True)
+        self._set_plot_checkboxes_checked(getattr(self, 'rosette_channel_checkboxes', {}).values(), True)
 
     def deselect_all_rosette_channels(self):
         """Deselect all Rosette channel checkboxes."""
-        for checkbox in getattr(self, 'rosette_channel_checkboxes', {}).values():
-            checkbox.setChecked(False)
+        self._set_plot_checkboxes_checked(getattr(self, 'rosette_channel_checkboxes', {}).values(), False)
 
     # ========================================================================
     # Plot Update Triggers
     # ========================================================================
 
     def trigger_plot_update(self):
-        """Trigger a debounced plot update to avoid lag."""
-        # Restart timer
-        self.plot_update_timer.stop()
+        """Schedule a throttled plot update to avoid lag.
+
+        Requests arriving while an update is already pending are folded into
+        it rather than restarting the timer, so a steady stream of triggers
+        redraws at a fixed rate instead of being postponed indefinitely.
+        """
+        if self.plot_update_timer.isActive():
+            return
         self.plot_update_timer.start(getattr(self, 'PLOT_UPDATE_DEBOUNCE', 200))
 
     def reset_graph_view(self):
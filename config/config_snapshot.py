@@ -18,6 +18,15 @@ VREF_LABEL_TO_COMMAND = {
     "3.3V (VDD)": "vdd",
 }
 
+# Reference command value -> reference voltage in volts.
+VREF_COMMAND_TO_VOLTS = {
+    "1.2": 1.2,
+    "3.3": 3.3,
+    "vdd": 3.3,
+    "0.8vdd": 3.3 * 0.8,
+    "ext": 1.25,
+}
+
 
 @dataclass(frozen=True, slots=True)
 class ADCConfigurationSnapshot:
@@ -13,6 +13,8 @@ from constants.sensor_config import (
 
 # Heatmap update rate
 HEATMAP_FPS = 30
+# Debounce interval for queued heatmap refreshes, derived from HEATMAP_FPS.
+HEATMAP_UPDATE_INTERVAL_MS = max(1, int(1000 / max(1, HEATMAP_FPS)))
 
 # Heatmap resolution (square display)
 HEATMAP_WIDTH = 160
@@ -10,6 +10,9 @@ PLOT_UPDATE_INTERVAL_SEC = 0.2
 # Plot rendering bounds
 MAX_TOTAL_POINTS_TO_DISPLAY = 12000
 MAX_PLOT_SWEEPS = 2000
+# M4 decimation keeps first/min/max/last per bin; with one bin per horizontal
+# pixel, four points per pixel reproduce the full-resolution trace exactly.
+PLOT_M4_POINTS_PER_PIXEL = 4
 PZR_ZERO_BASELINE_WINDOW_SEC = 1.0
 PZR_AUTO_BASELINE_DELAY_SEC = 1.5
 ROSETTE_BASELINE_SAMPLE_COUNT = 50
@@ -23,6 +26,27 @@ ROSETTE_FIXED_Y_MAX_LIMIT_OHMS = 1_000_000_000_000.0
 ROSETTE_FIXED_Y_STEP_OHMS = 10.0
 ROSETTE_FIXED_Y_DECIMALS = 2
 
+# Curve rendering: let pyqtgraph reduce what reaches arrayToQPath to the view
+# width (peak keeps min/max envelopes) and skip off-screen points. Antialiasing
+# is left off because it dominates paint time for dense traces.
+PLOT_ANTIALIAS = False
+CURVE_AUTO_DOWNSAMPLE = True
+CURVE_DOWNSAMPLE_METHOD = 'peak'
+CURVE_CLIP_TO_VIEW = True
+# ADC samples and the filters applied to them are always finite, so curves can
+# skip pyqtgraph's per-setData isfinite() scan of the whole series.
+CURVE_SKIP_FINITE_CHECK = True
+# Keep a device-pixel cache of each curve so repaints that do not touch its
+# data (cursor hover, region drags, overlapping items) blit instead of
+# re-stroking the path. setData and view-range changes still invalidate it.
+CURVE_DEVICE_COORDINATE_CACHE = True
+# Render plot viewports through OpenGL when PyOpenGL is installed. The
+# experimental GL curve path is not enabled because it ignores pen widths.
+PLOT_USE_OPENGL_IF_AVAILABLE = True
+# Let pyqtgraph build curve paths through its numba kernels when numba is
+# installed; it falls back to the NumPy path otherwise.
+PLOT_USE_NUMBA_IF_AVAILABLE = True
+
 # ADC Hardware Settings
 IADC_RESOLUTION_BITS = 12
 
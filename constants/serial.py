@@ -9,6 +9,13 @@ COMMAND_TERMINATOR = "***"
 CONFIG_RETRY_ATTEMPTS = 3
 CONFIG_COMMAND_TIMEOUT = 1.0
 CONFIG_RETRY_DELAY = 0.05
+# Retries back off exponentially from CONFIG_RETRY_DELAY with full jitter,
+# never waiting longer than this cap.
+CONFIG_RETRY_BACKOFF_CAP_SEC = 0.5
+# Sleep between Qt event pumps while waiting for a routed ADC reply line.
+ADC_LINE_WAIT_POLL_SEC = 0.01
+# How long Stop waits for bytes already in flight before dropping them.
+CAPTURE_STOP_DRAIN_MS = 150
 INTER_COMMAND_DELAY = 0.05
 
 # Arduino Communication Timing
@@ -39,7 +46,6 @@ TIMED_RUN_MAX = 3600000
 TIMED_RUN_DEFAULT = 1000
 
 # Serial Reader / Protocol Constants
-SERIAL_READER_IDLE_MS = 2
 FORCE_READER_IDLE_MS = 10
 SERIAL_READER_DEBUG_LOG_LIMIT = 10
 SERIAL_PACKET_HEADER_BYTES = 4
@@ -2,7 +2,6 @@
 
 # UI Update Timing
 FORCE_PLOT_DEBOUNCE_MS = 100
-CONFIG_CHECK_INTERVAL = 100
 SPECTRUM_UPDATE_INTERVAL_MS = 100
 # Trailing sweeps sampled when estimating the sample rate from sweep timestamps.
 SPECTRUM_RATE_ESTIMATE_MAX_SWEEPS = 200
@@ -52,3 +51,5 @@ CHANNEL_SCROLL_HEIGHT = 80
 
 # Maximum number of log lines to keep in status text window
 MAX_LOG_LINES = 1000
+# Status lines are coalesced and written to the widget at most this often (ms)
+STATUS_LOG_FLUSH_INTERVAL_MS = 100
@@ -9,14 +9,21 @@ from __future__ import annotations
 import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QGraphicsItem
 
 from constants.plotting import (
+    CURVE_AUTO_DOWNSAMPLE,
+    CURVE_CLIP_TO_VIEW,
+    CURVE_DEVICE_COORDINATE_CACHE,
+    CURVE_DOWNSAMPLE_METHOD,
+    CURVE_SKIP_FINITE_CHECK,
     IADC_RESOLUTION_BITS,
     MAX_PLOT_SWEEPS,
     MAX_TOTAL_POINTS_TO_DISPLAY,
     PZR_ZERO_BASELINE_WINDOW_SEC as PLOTTING_PZR_ZERO_BASELINE_WINDOW_SEC,
     PZR_AUTO_BASELINE_DELAY_SEC as PLOTTING_PZR_AUTO_BASELINE_DELAY_SEC,
     PLOT_COLORS,
+    PLOT_M4_POINTS_PER_PIXEL,
     ROSETTE_BASELINE_SAMPLE_COUNT,
     ROSETTE_FIXED_Y_MAX_DEFAULT_OHMS,
     ROSETTE_FIXED_Y_MIN_DEFAULT_OHMS,
@@ -50,7 +57,7 @@ class ADCPlottingMixin:
             return spec_key
         return None
 
-    def _get_ordered_active_buffer_snapshot(self, recent_window_sec=None):
+    def _get_ordered_active_buffer_snapshot(self, recent_window_sec=None, recent_sweeps=None):
         active_data_buffer = self.get_active_data_buffer()
         if active_data_buffer is None or self.samples_per_sweep <= 0:
             return None
@@ -64,9 +71,13 @@ class ADCPlottingMixin:
             return None
 
         avg_sample_time_sec = getattr(self, '_cached_avg_sample_time_sec', 0.0)
-        if recent_window_sec is not None and avg_sample_time_sec > 0:
+        requested_sweeps = None
+        if recent_sweeps is not None:
+            requested_sweeps = max(1, int(recent_sweeps))
+        elif recent_window_sec is not None and avg_sample_time_sec > 0:
             sweep_duration_sec = avg_sample_time_sec * max(1, self.samples_per_sweep)
             requested_sweeps = max(1, int(np.ceil(float(recent_window_sec) / sweep_duration_sec)) + 1)
+        if requested_sweeps is not None:
             actual_sweeps = min(actual_sweeps, requested_sweeps)
             snapshot = self._extract_recent_buffer_window(
                 active_data_buffer,
@@ -161,20 +172,28 @@ class ADCPlottingMixin:
 
     def capture_current_rosette_plot_baselines(self, sample_count=None, log_message=True):
         """Zero Rosette traces from the latest samples in each RS display stream."""
-        snapshot = self._get_ordered_active_buffer_snapshot()
+        display_specs = self.get_rosette_display_channel_specs()
+        baseline_sample_count = max(1, int(sample_count or ROSETTE_BASELINE_SAMPLE_COUNT))
+        # Only the trailing sweeps that hold the baseline samples are needed;
+        # the narrowest stream decides how many that is.
+        narrowest_stream = min(
+            (len(spec.get('sample_indices', [])) for spec in display_specs if spec.get('sample_indices')),
+            default=1,
+        )
+        snapshot = self._get_ordered_active_buffer_snapshot(
+            recent_sweeps=-(-baseline_sample_count // narrowest_stream)
+        )
         if snapshot is None:
             if log_message:
                 self.log_status("No Rosette data available to zero signals")
             return False
 
         data_array, _timestamps_array, _avg_sample_time_sec = snapshot
-        display_specs = self.get_rosette_display_channel_specs()
         if not display_specs:
             if log_message:
                 self.log_status("No Rosette channels available to zero signals")
             return False
 
-        baseline_sample_count = max(1, int(sample_count or ROSETTE_BASELINE_SAMPLE_COUNT))
         self.rosette_plot_baselines = {}
         for spec in display_specs:
             sample_indices = spec.get('sample_indices', [])
@@ -213,21 +232,38 @@ class ADCPlottingMixin:
         for curve in getattr(self, '_rosette_curves', {}).values():
             curve.setVisible(False)
 
+    def _invalidate_selected_plot_channels(self, *_args):
+        """Drop cached channel selections; connected to every selector checkbox."""
+        self._selected_plot_channels_cache = None
+        self._selected_rosette_plot_channels_cache = None
+
     def _get_selected_plot_channels(self):
-        """Return the set of currently selected channel keys."""
-        return {
-            channel_key
-            for channel_key, checkbox in self.channel_checkboxes.items()
-            if checkbox.isChecked()
-        }
+        """Return the set of currently selected channel keys.
+
+        Cached between checkbox toggles so redraws do not query every
+        checkbox on each tick.
+        """
+        selected = getattr(self, '_selected_plot_channels_cache', None)
+        if selected is None:
+            selected = frozenset(
+                channel_key
+                for channel_key, checkbox in self.channel_checkboxes.items()
+                if checkbox.isChecked()
+            )
+            self._selected_plot_channels_cache = selected
+        return selected
 
     def _get_selected_rosette_plot_channels(self):
         """Return currently selected Rosette channel keys."""
-        return {
-            channel_key
-            for channel_key, checkbox in getattr(self, 'rosette_channel_checkboxes', {}).items()
-            if checkbox.isChecked()
-        }
+        selected = getattr(self, '_selected_rosette_plot_channels_cache', None)
+        if selected is None:
+            selected = frozenset(
+                channel_key
+                for channel_key, checkbox in getattr(self, 'rosette_channel_checkboxes', {}).items()
+                if checkbox.isChecked()
+            )
+            self._selected_rosette_plot_channels_cache = selected
+        return selected
 
     @staticmethod
     def _apply_trailing_moving_average(values, window_size):
@@ -248,6 +284,39 @@ class ADCPlottingMixin:
         counts = ends - starts
         return sums / counts
 
+    @staticmethod
+    def _m4_sample_positions(values, bin_count):
+        """Return sorted positions of the first/min/max/last sample in each bin.
+
+        Keeping those four points per bin draws the same envelope as the full
+        series, so short spikes survive decimation instead of being skipped.
+        """
+        total = len(values)
+        bin_count = max(1, int(bin_count))
+        if total <= 4 * bin_count:
+            return np.arange(total, dtype=np.intp)
+
+        bin_size = -(-total // bin_count)
+        full_bins = total // bin_size
+        full_span = full_bins * bin_size
+        binned = np.asarray(values[:full_span]).reshape(full_bins, bin_size)
+        starts = np.arange(0, full_span, bin_size, dtype=np.intp)
+        columns = [
+            starts,
+            starts + binned.argmin(axis=1),
+            starts + binned.argmax(axis=1),
+            starts + (bin_size - 1),
+        ]
+        if full_span < total:
+            tail = np.asarray(values[full_span:])
+            columns = [
+                np.append(columns[0], full_span),
+                np.append(columns[1], full_span + int(tail.argmin())),
+                np.append(columns[2], full_span + int(tail.argmax())),
+                np.append(columns[3], total - 1),
+            ]
+        return np.unique(np.concatenate(columns))
+
     def _extract_recent_buffer_window(self, active_data_buffer, actual_sweeps, current_write_index, window_sweeps):
         """Copy the requested trailing window from the circular sweep buffers."""
         slices = recent_window_slices(
@@ -356,39 +425,104 @@ class ADCPlottingMixin:
         snapshot_key = (generation, int(current_write_index), int(display_sweeps), int(history_sweeps))
         return data_array, timestamps_array, int(display_sweeps), snapshot_key
 
-    def _prepare_channel_plot_series(self, spec, data_array, timestamps_array, avg_sample_time_sec, max_samples_per_series):
-        """Build flattened channel samples/timestamps for plotting without changing behavior."""
+    def _get_series_display_settings(self):
+        """Read the display controls shared by every series once per redraw."""
+        is_555 = getattr(self, 'device_mode', 'adc') == '555'
+        voltage_gain = 1.0
+        if not is_555 and self.yaxis_units_combo.currentText() == "Voltage":
+            voltage_gain = self.get_vref_voltage() / ((2 ** IADC_RESOLUTION_BITS) - 1)
+        subtract_baseline = bool(
+            getattr(self, 'subtract_baseline_check', None)
+            and self.subtract_baseline_check.isChecked()
+            and not (
+                hasattr(self, 'should_remove_pzt_ghost')
+                and self.should_remove_pzt_ghost()
+            )
+        )
+        return {
+            'is_555': is_555,
+            'voltage_gain': voltage_gain,
+            'subtract_baseline': subtract_baseline,
+            'adc_polarity': self._active_sensor_polarity_multiplier({}),
+        }
+
+    def _prepare_channel_plot_series(
+        self,
+        spec,
+        data_array,
+        timestamps_array,
+        avg_sample_time_sec,
+        max_samples_per_series,
+        display_settings=None,
+        repeat_count=1,
+        moving_average_window=1,
+    ):
+        """Build flattened channel samples/timestamps for plotting without changing behavior.
+
+        Long windows are reduced with M4 (first/min/max/last per bin) before the
+        unit/baseline/polarity transforms, so those touch at most
+        ``max_samples_per_series`` points regardless of window length. With
+        ``repeat_count`` > 1, whole repeat groups are kept so the per-repeat and
+        average views can still reshape the result to ``(-1, repeat_count)``.
+        A ``moving_average_window`` > 1 smooths the full-rate series before
+        decimation, so the trailing mean never runs over M4 envelope points.
+        """
         sample_indices = spec['sample_indices']
         if not sample_indices:
             return None
 
-        sample_index_array = np.asarray(sample_indices, dtype=np.int32)
-        channel_data = data_array[:, sample_index_array].reshape(-1)
-
-        time_offsets = sample_index_array.astype(np.float64) * avg_sample_time_sec
-        channel_times = (timestamps_array.reshape(-1, 1) + time_offsets.reshape(1, -1)).reshape(-1)
-
-        latest_value = float(channel_data[-1]) if len(channel_data) > 0 else None
-
+        sample_index_array = np.asarray(sample_indices, dtype=np.intp)
+        samples_per_sweep = len(sample_index_array)
+        total_points = len(data_array) * samples_per_sweep
+
+        if total_points > max_samples_per_series:
+            # Reduce to per-bin first/min/max/last so peaks stay visible at the
+            # same vertex budget a plain stride would use.
+            all_channel_data = data_array[:, sample_index_array].reshape(-1)
+            if moving_average_window > 1:
+                all_channel_data = self._apply_trailing_moving_average(all_channel_data, moving_average_window)
+            if repeat_count > 1 and samples_per_sweep % repeat_count == 0:
+                # Pick groups by M4 over the repeat means, then keep every
+                # repeat of each chosen group so columns stay aligned.
+                group_means = all_channel_data.reshape(-1, repeat_count).mean(axis=1)
+                group_positions = self._m4_sample_positions(
+                    group_means, max_samples_per_series // (4 * repeat_count)
+                )
+                flat_positions = (
+                    group_positions[:, np.newaxis] * repeat_count + np.arange(repeat_count)
+                ).reshape(-1)
+            else:
+                flat_positions = self._m4_sample_positions(all_channel_data, max_samples_per_series // 4)
+            channel_data = all_channel_data[flat_positions]
+            sweep_rows, slots = np.divmod(flat_positions, samples_per_sweep)
+            sample_columns = sample_index_array[slots]
+        else:
+            flat_positions = np.arange(total_points)
+            sweep_rows, slots = np.divmod(flat_positions, samples_per_sweep)
+            sample_columns = sample_index_array[slots]
+            channel_data = data_array[sweep_rows, sample_columns]
+            if moving_average_window > 1:
+                channel_data = self._apply_trailing_moving_average(channel_data, moving_average_window)
+        channel_times = timestamps_array[sweep_rows] + sample_columns.astype(np.float64) * avg_sample_time_sec
+
+        if total_points == 0:
+            return self._apply_active_sensor_polarity(spec, channel_data), channel_times, None
+
+        # The newest sample may fall between decimated points; carry it through
+        # the same transforms so the latest readout stays exact.
+        raw_latest = data_array[-1, sample_index_array[-1]]
+        channel_data = np.append(channel_data, raw_latest)
+
+        if display_settings is None:
+            display_settings = self._get_series_display_settings()
+
+        # Unit conversion, baseline subtraction, and polarity are all affine, so
+        # fold them into one gain/offset pair and make a single pass over the data.
         is_rs_stream = spec.get('stream') == 'rs'
-        if (
-            not is_rs_stream
-            and getattr(self, 'device_mode', 'adc') != '555'
-            and self.yaxis_units_combo.currentText() == "Voltage"
-        ):
-            vref = self.get_vref_voltage()
-            max_adc_value = (2 ** IADC_RESOLUTION_BITS) - 1
-            channel_data = (channel_data / max_adc_value) * vref
+        gain = 1.0 if is_rs_stream else display_settings['voltage_gain']
+        offset = 0.0
 
-        if (
-            not is_rs_stream
-            and getattr(self, 'subtract_baseline_check', None)
-            and self.subtract_baseline_check.isChecked()
-            and not (
-                hasattr(self, 'should_remove_pzt_ghost')
-                and self.should_remove_pzt_ghost()
-            )
-        ):
+        if not is_rs_stream and display_settings['subtract_baseline']:
             if spec['key'] not in self.plot_baselines:
                 self.capture_current_plot_baselines(
                     log_message=False,
@@ -396,51 +530,100 @@ class ADCPlottingMixin:
                 )
 
             if spec['key'] in self.plot_baselines:
-                baseline_value = float(self.plot_baselines[spec['key']])
-                if (
-                    getattr(self, 'device_mode', 'adc') != '555'
-                    and self.yaxis_units_combo.currentText() == "Voltage"
-                ):
-                    # Baselines are captured from raw ADC counts; convert to volts
-                    # before subtracting from voltage-domain display data.
-                    vref = self.get_vref_voltage()
-                    max_adc_value = (2 ** IADC_RESOLUTION_BITS) - 1
-                    baseline_value = (baseline_value / max_adc_value) * vref
-                channel_data = channel_data - baseline_value
+                # Baselines are captured from raw ADC counts; the shared gain
+                # converts them to volts alongside the display data.
+                offset = -float(self.plot_baselines[spec['key']]) * gain
 
-        channel_data = self._apply_active_sensor_polarity(spec, channel_data)
-        if getattr(self, 'device_mode', 'adc') != '555':
-            latest_value = float(channel_data[-1]) if len(channel_data) > 0 else None
+        multiplier = SENSOR_POLARITY_NORMAL_MULTIPLIER if is_rs_stream else display_settings['adc_polarity']
+        channel_data = np.multiply(channel_data, gain * multiplier, dtype=np.float64)
+        if offset:
+            channel_data += offset * multiplier
 
-        if len(channel_data) > max_samples_per_series:
-            downsample_factor = max(1, len(channel_data) // max_samples_per_series)
-            channel_data = channel_data[::downsample_factor]
-            channel_times = channel_times[::downsample_factor]
+        if not display_settings['is_555']:
+            latest_value = float(channel_data[-1])
+        else:
+            latest_value = float(raw_latest)
 
-        return channel_data, channel_times, latest_value
+        return channel_data[:-1], channel_times, latest_value
 
-    def _apply_active_sensor_polarity(self, spec, values):
-        """Flip ADC trace sign for reverse-polarity sensor packages."""
-        samples = np.asarray(values, dtype=np.float64)
+    def _active_sensor_polarity_multiplier(self, spec):
+        """Return the sign applied to a trace for reverse-polarity sensor packages."""
         if getattr(self, 'device_mode', 'adc') == '555':
-            return samples
+            return SENSOR_POLARITY_NORMAL_MULTIPLIER
         if spec.get('stream') == 'rs':
-            return samples
+            return SENSOR_POLARITY_NORMAL_MULTIPLIER
         reverse_polarity = False
         if hasattr(self, 'is_active_sensor_reverse_polarity'):
             reverse_polarity = bool(self.is_active_sensor_reverse_polarity())
-        multiplier = (
+        return (
             SENSOR_POLARITY_REVERSED_MULTIPLIER
             if reverse_polarity
             else SENSOR_POLARITY_NORMAL_MULTIPLIER
         )
-        return samples * multiplier
+
+    def _apply_active_sensor_polarity(self, spec, values):
+        """Flip ADC trace sign for reverse-polarity sensor packages."""
+        samples = np.asarray(values, dtype=np.float64)
+        return samples * self._active_sensor_polarity_multiplier(spec)
+
+    @staticmethod
+    def _configure_curve_rendering(curve):
+        """Limit the points a curve rasterizes to what the view can show."""
+        curve.setDownsampling(auto=CURVE_AUTO_DOWNSAMPLE, method=CURVE_DOWNSAMPLE_METHOD)
+        curve.setClipToView(CURVE_CLIP_TO_VIEW)
+        if CURVE_DEVICE_COORDINATE_CACHE:
+            curve.curve.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
+    @staticmethod
+    def _pixel_limited_sample_budget(plot_widget, max_samples):
+        """Cap a per-series point budget at M4's four points per horizontal pixel."""
+        try:
+            width = int(plot_widget.width())
+        except (AttributeError, TypeError):
+            return max_samples
+        if width <= 0:
+            return max_samples
+        return min(max_samples, width * PLOT_M4_POINTS_PER_PIXEL)
+
+    def _get_plot_pen(self, color, width, style=None):
+        """Return a shared pen for one color/width/style combination.
+
+        Curves are restyled on every redraw; reusing the same QPen avoids
+        building a new one per curve per frame.
+        """
+        pen_cache = getattr(self, '_plot_pen_cache', None)
+        if pen_cache is None:
+            pen_cache = {}
+            self._plot_pen_cache = pen_cache
+        key = (color, width, style)
+        pen = pen_cache.get(key)
+        if pen is None:
+            if style is None:
+                pen = pg.mkPen(color=color, width=width)
+            else:
+                pen = pg.mkPen(color=color, width=width, style=style)
+            pen_cache[key] = pen
+        return pen
+
+    @staticmethod
+    def _apply_curve_pen(curve, pen):
+        """Set a cached pen on a curve unless that same pen is already applied.
+
+        setPen copies the pen and schedules a repaint, so skipping the call
+        when the cached pen object is unchanged keeps redraws to setData only.
+        """
+        if getattr(curve, '_applied_plot_pen', None) is pen:
+            return
+        curve.setPen(pen)
+        curve._applied_plot_pen = pen
 
     def _get_or_create_adc_curve(self, curve_key, name, pen):
         """Fetch an existing ADC curve or create it on first use."""
         curve = self._adc_curves.get(curve_key)
         if curve is None:
             curve = self.plot_widget.plot([], pen=pen, name=name)
+            curve._applied_plot_pen = pen
+            self._configure_curve_rendering(curve)
             self._adc_curves[curve_key] = curve
         return curve
 
@@ -451,6 +634,8 @@ class ADCPlottingMixin:
         curve = self._rosette_curves.get(curve_key)
         if curve is None:
             curve = self.rosette_plot_widget.plot([], pen=pen, name=name)
+            curve._applied_plot_pen = pen
+            self._configure_curve_rendering(curve)
             self._rosette_curves[curve_key] = curve
         return curve
 
@@ -458,15 +643,15 @@ class ADCPlottingMixin:
         """Apply visibility, style, and samples to a single ADC curve."""
         curve = self._get_or_create_adc_curve(curve_key, name, pen)
         curve.setVisible(True)
-        curve.setPen(pen)
-        curve.setData(x=x_data, y=y_data)
+        self._apply_curve_pen(curve, pen)
+        curve.setData(x=x_data, y=y_data, skipFiniteCheck=CURVE_SKIP_FINITE_CHECK)
 
     def _set_rosette_curve_data(self, curve_key, name, pen, x_data, y_data):
         """Apply visibility, style, and samples to a single Rosette curve."""
         curve = self._get_or_create_rosette_curve(curve_key, name, pen)
         curve.setVisible(True)
-        curve.setPen(pen)
-        curve.setData(x=x_data, y=y_data)
+        self._apply_curve_pen(curve, pen)
+        curve.setData(x=x_data, y=y_data, skipFiniteCheck=CURVE_SKIP_FINITE_CHECK)
 
     def _update_plot_axis_labels(self):
         """Update plot axes labels for the active visualization mode."""
@@ -516,10 +701,10 @@ class ADCPlottingMixin:
                 repeat_times = channel_times_2d[:, repeat_idx]
 
                 if repeat_idx == 0:
-                    pen = pg.mkPen(color=color, width=2)
+                    pen = self._get_plot_pen(color, 2)
                 else:
                     lighter_color = tuple(int(c * 0.7) for c in color)
-                    pen = pg.mkPen(color=lighter_color, width=1.5, style=Qt.PenStyle.DashLine)
+                    pen = self._get_plot_pen(lighter_color, 1.5, Qt.PenStyle.DashLine)
 
                 name = f"{spec['label']}.{repeat_idx}"
                 curve_key = ("repeat", spec['key'], repeat_idx)
@@ -531,9 +716,20 @@ class ADCPlottingMixin:
             self.log_status(f"ERROR: Failed to reshape repeat data - {e}")
             return False
 
-    def _plot_single_or_average_series(self, spec, color, channel_data, channel_times, repeat_count, desired_curve_keys):
+    def _plot_single_or_average_series(
+        self,
+        spec,
+        color,
+        channel_data,
+        channel_times,
+        repeat_count,
+        desired_curve_keys,
+        show_average=None,
+    ):
         """Render either the averaged repeat series or the default single curve."""
-        if self.show_average_radio.isChecked() and repeat_count > 1:
+        if show_average is None:
+            show_average = self.show_average_radio.isChecked()
+        if show_average and repeat_count > 1:
             try:
                 num_samples = len(channel_data) // repeat_count
                 if num_samples <= 0:
@@ -544,14 +740,14 @@ class ADCPlottingMixin:
                 channel_data = np.mean(channel_data_2d, axis=1)
                 channel_times = channel_times_2d[:, 0]
                 name = f"{spec['label']} (avg)"
-                pen = pg.mkPen(color=color, width=3, style=Qt.PenStyle.DashLine)
+                pen = self._get_plot_pen(color, 3, Qt.PenStyle.DashLine)
                 curve_key = ("avg", spec['key'], 0)
             except Exception as e:
                 self.log_status(f"ERROR: Failed to average repeat data - {e}")
                 return False
         else:
             name = spec['label']
-            pen = pg.mkPen(color=color, width=2)
+            pen = self._get_plot_pen(color, 2)
             curve_key = ("single", spec['key'], 0)
 
         desired_curve_keys.add(curve_key)
@@ -582,21 +778,32 @@ class ADCPlottingMixin:
 
         desired_curve_keys = set()
         total_samples = 0
-        max_samples_per_rosette = max(
-            500,
-            MAX_TOTAL_POINTS_TO_DISPLAY // max(1, len(selected_rosettes)),
+        max_samples_per_rosette = self._pixel_limited_sample_budget(
+            self.rosette_plot_widget,
+            max(500, MAX_TOTAL_POINTS_TO_DISPLAY // max(1, len(selected_rosettes))),
         )
+        moving_average_window = 1
+        if (
+            getattr(self, 'rosette_moving_average_check', None)
+            and self.rosette_moving_average_check.isChecked()
+        ):
+            spin = getattr(self, 'rosette_moving_average_spin', None)
+            moving_average_window = int(spin.value()) if spin is not None else 10
+
         for spec in display_specs:
             if spec['key'] not in selected_rosettes:
                 continue
 
             color = PLOT_COLORS[spec['color_slot'] % len(PLOT_COLORS)]
+            # Smooth at full rate inside the prepare step; averaging the M4
+            # output would average envelope extremes instead of the signal.
             prepared_series = self._prepare_channel_plot_series(
                 spec,
                 data_array,
                 timestamps_array,
                 avg_sample_time_sec,
                 max(max_samples_per_series, max_samples_per_rosette),
+                moving_average_window=moving_average_window,
             )
             if prepared_series is None:
                 continue
@@ -612,16 +819,8 @@ class ADCPlottingMixin:
                 if spec['key'] in getattr(self, 'rosette_plot_baselines', {}):
                     channel_data = channel_data - self.rosette_plot_baselines[spec['key']]
 
-            if (
-                getattr(self, 'rosette_moving_average_check', None)
-                and self.rosette_moving_average_check.isChecked()
-            ):
-                spin = getattr(self, 'rosette_moving_average_spin', None)
-                window_size = int(spin.value()) if spin is not None else 10
-                channel_data = self._apply_trailing_moving_average(channel_data, window_size)
-
             total_samples += len(channel_data)
-            pen = pg.mkPen(color=color, width=2)
+            pen = self._get_plot_pen(color, 2)
             curve_key = ('rs', spec['key'])
             desired_curve_keys.add(curve_key)
             self._set_rosette_curve_data(curve_key, spec['label'], pen, channel_times, channel_data)
@@ -731,50 +930,70 @@ class ADCPlottingMixin:
             desired_curve_keys = set()
             latest_channel_values = {}
             visible_series_count = max(1, len(selected_channels))
-            max_samples_per_series = max(500, MAX_TOTAL_POINTS_TO_DISPLAY // visible_series_count)
+            max_samples_per_series = self._pixel_limited_sample_budget(
+                self.plot_widget,
+                max(500, MAX_TOTAL_POINTS_TO_DISPLAY // visible_series_count),
+            )
             avg_sample_time_sec = getattr(self, '_cached_avg_sample_time_sec', 0.0)
 
-            for spec in display_specs:
-                if spec['key'] not in selected_channels:
-                    continue
-
-                color = PLOT_COLORS[spec['color_slot'] % len(PLOT_COLORS)]
-                prepared_series = self._prepare_channel_plot_series(
-                    spec,
-                    data_array,
-                    timestamps_array,
-                    avg_sample_time_sec,
-                    max_samples_per_series,
-                )
-                if prepared_series is None:
-                    continue
-
-                channel_data, channel_times, latest_value = prepared_series
-
-                if latest_value is not None:
-                    latest_channel_values[spec['label']] = latest_value
-
-                if self.show_all_repeats_radio.isChecked() and repeat_count > 1:
-                    if not self._plot_repeat_series(
-                        spec,
-                        color,
-                        channel_data,
-                        channel_times,
-                        repeat_count,
-                        desired_curve_keys,
-                    ):
+            # Widget state is fixed for the duration of one redraw; read it once
+            # here instead of once per channel inside the loop.
+            display_settings = self._get_series_display_settings()
+            show_all_repeats = self.show_all_repeats_radio.isChecked() and repeat_count > 1
+            show_average = self.show_average_radio.isChecked()
+            prepare_series = self._prepare_channel_plot_series
+            color_count = len(PLOT_COLORS)
+
+            # Hold repaints until every channel curve has new data so the
+            # viewport repaints once per redraw instead of once per curve.
+            self.plot_widget.setUpdatesEnabled(False)
+            try:
+                for spec in display_specs:
+                    if spec['key'] not in selected_channels:
                         continue
-                else:
-                    if not self._plot_single_or_average_series(
+
+                    color = PLOT_COLORS[spec['color_slot'] % color_count]
+                    prepared_series = prepare_series(
                         spec,
-                        color,
-                        channel_data,
-                        channel_times,
+                        data_array,
+                        timestamps_array,
+                        avg_sample_time_sec,
+                        max_samples_per_series,
+                        display_settings,
                         repeat_count,
-                        desired_curve_keys,
-                    ):
+                    )
+                    if prepared_series is None:
                         continue
 
+                    channel_data, channel_times, latest_value = prepared_series
+
+                    if latest_value is not None:
+                        latest_channel_values[spec['label']] = latest_value
+
+                    if show_all_repeats:
+                        if not self._plot_repeat_series(
+                            spec,
+                            color,
+                            channel_data,
+                            channel_times,
+                            repeat_count,
+                            desired_curve_keys,
+                        ):
+                            continue
+                    else:
+                        if not self._plot_single_or_average_series(
+                            spec,
+                            color,
+                            channel_data,
+                            channel_times,
+                            repeat_count,
+                            desired_curve_keys,
+                            show_average,
+                        ):
+                            continue
+            finally:
+                self.plot_widget.setUpdatesEnabled(True)
+
             for key, curve in self._adc_curves.items():
                 if key not in desired_curve_keys:
                     curve.setVisible(False)
@@ -47,6 +47,7 @@ class ArchiveWriterThread(threading.Thread):
     _GIL_YIELD_SEC = 0.002
     _QUEUE_GET_TIMEOUT_SEC = 0.1
     _DRAIN_IDLE_GRACE_SEC = 0.25
+    _WRITE_BUFFER_BYTES = 1 << 20
 
     def __init__(self, archive_path: str, metadata: dict):
         super().__init__(name="ArchiveWriter", daemon=True)
@@ -102,7 +103,9 @@ class ArchiveWriterThread(threading.Thread):
 
     def run(self):
         try:
-            with open(self._archive_path, "w", encoding="utf-8") as handle:
+            with open(
+                self._archive_path, "w", encoding="utf-8", buffering=self._WRITE_BUFFER_BYTES
+            ) as handle:
                 handle.write(json.dumps(self._metadata) + "\n")
                 self._transition_state(self.STATE_OPEN)
 
@@ -125,12 +128,12 @@ class ArchiveWriterThread(threading.Thread):
 
                     sweep_timestamps, block_array = item
 
-                    lines = []
-                    for ts, row in zip(sweep_timestamps, block_array):
-                        lines.append(
-                            json.dumps({"timestamp_s": float(ts), "samples": row.tolist()})
-                            + "\n"
-                        )
+                    # Convert the whole block to Python values in one call each
+                    # rather than once per sweep row.
+                    lines = [
+                        json.dumps({"timestamp_s": float(ts), "samples": row}) + "\n"
+                        for ts, row in zip(sweep_timestamps.tolist(), block_array.tolist())
+                    ]
                     handle.write("".join(lines))
                     with self._state_lock:
                         self._written_blocks += 1
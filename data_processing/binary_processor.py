@@ -14,7 +14,7 @@ from constants.plotting import (
     PLOT_UPDATE_INTERVAL_SEC,
 )
 from constants.pressure_map import PRESSURE_MAP_PLOT_UPDATE_INTERVAL_SEC
-from constants.runtime import MAX_TIMING_SAMPLES
+from data_processing.circular_buffer import put_block, write_slices
 from data_processing.force_state import get_force_runtime_state
 
 
@@ -53,28 +53,24 @@ class BinaryProcessorMixin:
                 # Track buffer arrival time (start of reception)
                 block_start_time = time.time()
                 
-                # Keep only last 1000 buffer receipt times to prevent unbounded growth
+                # Timing histories are bounded deques, so old entries drop off on append
                 timing.buffer_receipt_times.append(block_start_time)
-                timing.trim_recent('buffer_receipt_times', MAX_TIMING_SAMPLES)
                 
-                # Track first sweep time for rate calculation - thread safe
-                with self.buffer_lock:
-                    is_first_sweep = (self.sweep_count == 0)
+                # Track first sweep time for rate calculation. sweep_count is only
+                # advanced below on this (GUI) thread, so no lock is needed to read it.
+                is_first_sweep = (self.sweep_count == 0)
                 
                 if is_first_sweep:
                     timing.capture_start_time = block_start_time
                     force_state.start_time = timing.capture_start_time  # Sync force timing
                     timing.last_buffer_time = block_start_time
                 
-                # Store the average sampling time from Arduino (keep only last 1000)
+                # Store the average sampling time from Arduino
                 timing.arduino_sample_times.append(avg_sample_time_us)
-                timing.trim_recent('arduino_sample_times', MAX_TIMING_SAMPLES)
 
-                # Store MCU block timestamps (keep only last 1000)
+                # Store MCU block timestamps
                 timing.mcu_block_start_us.append(block_start_us)
                 timing.mcu_block_end_us.append(block_end_us)
-                timing.trim_recent('mcu_block_start_us', MAX_TIMING_SAMPLES)
-                timing.trim_recent('mcu_block_end_us', MAX_TIMING_SAMPLES)
 
                 # Capture-wide MCU timing accumulators are deliberately not trimmed.
                 # The block footer spans acquisition only; the inter-block gap below
@@ -88,32 +84,37 @@ class BinaryProcessorMixin:
                 if timing.mcu_last_block_end_us is not None:
                     gap_us = (block_start_us - timing.mcu_last_block_end_us) & 0xFFFFFFFF
                     timing.mcu_block_gap_us.append(gap_us)
-                    timing.trim_recent('mcu_block_gap_us', MAX_TIMING_SAMPLES)
                     timing.adc_block_gap_total_us += gap_us
                     timing.adc_block_gap_count += 1
                 timing.mcu_last_block_end_us = block_end_us
                 
-                # Calculate samples per sweep from the same physical-width rule
-                # used when capture starts, so parser expectations and buffer
-                # layout stay aligned for paired-MUX array modes.
-                samples_per_sweep = self.get_effective_samples_per_sweep()
+                # Use the sweep width pinned when the capture run started, so
+                # the per-block path skips the channel-layout lookup.  Fall back
+                # to the same physical-width rule if no run width was pinned.
+                samples_per_sweep = getattr(self, '_capture_samples_per_sweep', None)
+                if not samples_per_sweep:
+                    samples_per_sweep = self.get_effective_samples_per_sweep()
                 
                 if samples_per_sweep == 0:
                     self.log_status("ERROR: Invalid configuration, samples_per_sweep is 0")
                     return
                 
-                # Initialize numpy buffers if not done or if config changed - THREAD SAFE
-                with self.buffer_lock:
-                    if (self.raw_data_buffer is None or 
-                        self.samples_per_sweep != samples_per_sweep):
-                        self.samples_per_sweep = samples_per_sweep
-                        self.raw_data_buffer = np.zeros((self.MAX_SWEEPS_BUFFER, samples_per_sweep), dtype=np.float32)
-                        self.processed_data_buffer = np.zeros((self.MAX_SWEEPS_BUFFER, samples_per_sweep), dtype=np.float32)
-                        self.sweep_timestamps_buffer = np.zeros(self.MAX_SWEEPS_BUFFER, dtype=np.float64)
-                        self.buffer_write_index = 0
-                        self.log_status(f"Initialized numpy buffers: {self.MAX_SWEEPS_BUFFER} sweeps × {samples_per_sweep} samples")
-                    elif self.processed_data_buffer is None or self.processed_data_buffer.shape != self.raw_data_buffer.shape:
-                        self.processed_data_buffer = np.zeros_like(self.raw_data_buffer, dtype=np.float32)
+                # Initialize numpy buffers if not done or if config changed - THREAD SAFE.
+                # Buffers are only reallocated on this (GUI) thread, so the
+                # unlocked pre-check is stable; steady-state blocks then take
+                # the lock once, for the ring write below.
+                if self._sweep_buffers_need_allocation(samples_per_sweep):
+                    with self.buffer_lock:
+                        if (self.raw_data_buffer is None or 
+                            self.samples_per_sweep != samples_per_sweep):
+                            self.samples_per_sweep = samples_per_sweep
+                            self.raw_data_buffer = np.zeros((self.MAX_SWEEPS_BUFFER, samples_per_sweep), dtype=np.float32)
+                            self.processed_data_buffer = np.zeros((self.MAX_SWEEPS_BUFFER, samples_per_sweep), dtype=np.float32)
+                            self.sweep_timestamps_buffer = np.zeros(self.MAX_SWEEPS_BUFFER, dtype=np.float64)
+                            self.buffer_write_index = 0
+                            self.log_status(f"Initialized numpy buffers: {self.MAX_SWEEPS_BUFFER} sweeps × {samples_per_sweep} samples")
+                        elif self.processed_data_buffer is None or self.processed_data_buffer.shape != self.raw_data_buffer.shape:
+                            self.processed_data_buffer = np.zeros_like(self.raw_data_buffer, dtype=np.float32)
                 
                 # The sample count comes from the header, which reflects what Arduino actually sent
                 # Arduino may reduce sweeps per block to fit in RAM, so use actual count
@@ -138,22 +139,24 @@ class BinaryProcessorMixin:
                 # Keep a float archive candidate separate from the display block.  In
                 # PZT_RS mode the display block scales only RS slots to ohms, while
                 # archives retain the established wire-unit representation.
+                # Without ghost removal the archive takes the uint16 block as-is, so
+                # the float copy (and the ghost passes below) are only made when needed.
+                ghost_removal_active = bool(
+                    hasattr(self, 'should_remove_pzt_ghost') and self.should_remove_pzt_ghost()
+                )
                 block_u16 = samples[:total_samples].reshape(sweeps_in_block, samples_per_sweep)
                 block_samples_array = block_u16.astype(np.float32)
-                archive_samples_array = block_samples_array.copy()
+                archive_samples_array = block_samples_array.copy() if ghost_removal_active else None
                 if hasattr(self, 'scale_pzt_rs_rosette_samples_inplace'):
                     self.scale_pzt_rs_rosette_samples_inplace(
                         block_samples_array,
                         channels=self.config.get('channels', []),
                         repeat_count=self.config.get('repeat', 1),
                     )
-                # Track block sizing for timing export (keep only recent)
+                # Track block sizing for timing export
                 timing.block_sample_counts.append(total_samples)
                 timing.block_sweeps_counts.append(sweeps_in_block)
                 timing.block_samples_per_sweep.append(samples_per_sweep)
-                timing.trim_recent('block_sample_counts', MAX_TIMING_SAMPLES)
-                timing.trim_recent('block_sweeps_counts', MAX_TIMING_SAMPLES)
-                timing.trim_recent('block_samples_per_sweep', MAX_TIMING_SAMPLES)
 
                 # Stream block timing to sidecar (if open)
                 if store_capture_data and self._block_timing_file:
@@ -161,7 +164,13 @@ class BinaryProcessorMixin:
                         gap_us = ""
                         if timing.mcu_block_gap_us:
                             gap_us = timing.mcu_block_gap_us[-1]
-                        tw = csv.writer(self._block_timing_file)
+                        # Reuse one csv.writer per sidecar file instead of
+                        # building a new one for every block.
+                        timing_csv = getattr(self, '_block_timing_csv', None)
+                        if timing_csv is None or timing_csv[0] is not self._block_timing_file:
+                            timing_csv = (self._block_timing_file, csv.writer(self._block_timing_file))
+                            self._block_timing_csv = timing_csv
+                        tw = timing_csv[1]
                         self._block_timing_write_count += 1
                         if self._block_timing_write_count % 100 == 0:
                             try:
@@ -193,12 +202,10 @@ class BinaryProcessorMixin:
 
                 # Initialize first-sweep timestamp reference once per capture.
                 if not hasattr(self, 'first_sweep_timestamp_us'):
-                    with self.buffer_lock:
-                        if not hasattr(self, 'first_sweep_timestamp_us'):
-                            self.first_sweep_timestamp_us = int(sweep_timestamps_us[0])
-                            self.log_status(
-                                f"First sweep timestamp initialized: {self.first_sweep_timestamp_us} µs (wrap-safe)"
-                            )
+                    self.first_sweep_timestamp_us = int(sweep_timestamps_us[0])
+                    self.log_status(
+                        f"First sweep timestamp initialized: {self.first_sweep_timestamp_us} µs (wrap-safe)"
+                    )
 
                 delta_us = (sweep_timestamps_us - self.first_sweep_timestamp_us) & 0xFFFFFFFF
                 sweep_timestamps_sec = delta_us / 1_000_000.0
@@ -207,19 +214,18 @@ class BinaryProcessorMixin:
                     hasattr(self, 'is_pzt_ghost_calibration_pending')
                     and self.is_pzt_ghost_calibration_pending()
                 )
-                if hasattr(self, 'prepare_pzt_ghost_block'):
+                if ghost_removal_active and hasattr(self, 'prepare_pzt_ghost_block'):
                     block_samples_array = self.prepare_pzt_ghost_block(block_samples_array)
                     archive_samples_array = self.prepare_pzt_ghost_block(archive_samples_array)
 
                 # --- Vectorized circular buffer write (single lock per block) ---
                 with self.buffer_lock:
-                    block_write_base = self.buffer_write_index
-                    positions = (
-                        block_write_base + np.arange(sweeps_in_block)
-                    ) % self.MAX_SWEEPS_BUFFER
-                    self.raw_data_buffer[positions] = block_samples_array
-                    self.processed_data_buffer[positions] = block_samples_array
-                    self.sweep_timestamps_buffer[positions] = sweep_timestamps_sec
+                    slices = write_slices(
+                        self.buffer_write_index, sweeps_in_block, self.MAX_SWEEPS_BUFFER
+                    )
+                    put_block(self.raw_data_buffer, slices, block_samples_array)
+                    put_block(self.processed_data_buffer, slices, block_samples_array)
+                    put_block(self.sweep_timestamps_buffer, slices, sweep_timestamps_sec)
                     self.buffer_write_index += sweeps_in_block
                     self.sweep_count += sweeps_in_block
 
@@ -247,11 +253,7 @@ class BinaryProcessorMixin:
                             for pending_timestamps, pending_block in self.pop_clean_pzt_ghost_archive_blocks():
                                 self._archive_writer.enqueue(pending_timestamps, pending_block)
                     else:
-                        archive_block = (
-                            archive_samples_array
-                            if hasattr(self, 'should_remove_pzt_ghost') and self.should_remove_pzt_ghost()
-                            else block_u16
-                        )
+                        archive_block = archive_samples_array if ghost_removal_active else block_u16
                         self._archive_writer.enqueue(sweep_timestamps_sec, archive_block)
 
                 # Rate-limit plot updates using wall-clock time.
@@ -354,8 +356,6 @@ class BinaryProcessorMixin:
                 if timing.last_buffer_end_time is not None:
                     gap_time_ms = (block_start_time - timing.last_buffer_end_time) * 1000.0
                     timing.buffer_gap_times.append(gap_time_ms)
-                    # Keep only recent gap times to prevent unbounded growth
-                    timing.trim_recent('buffer_gap_times', MAX_TIMING_SAMPLES)
                 
                 timing.last_buffer_end_time = block_end_time
                 
@@ -371,6 +371,14 @@ class BinaryProcessorMixin:
             except Exception as e:
                 self.log_status(f"ERROR: Failed to process binary block - {e}")
 
+    def _sweep_buffers_need_allocation(self, samples_per_sweep: int) -> bool:
+        """Return True when the ring buffers are missing or sized for another layout."""
+        raw_buffer = self.raw_data_buffer
+        if raw_buffer is None or self.samples_per_sweep != samples_per_sweep:
+            return True
+        processed_buffer = self.processed_data_buffer
+        return processed_buffer is None or processed_buffer.shape != raw_buffer.shape
+
     def _maybe_log_slow_timeseries_redraw(
         self,
         *,
@@ -17,6 +17,7 @@ from PyQt6.QtWidgets import QMessageBox
 from constants.capture_archive import CACHE_SUBDIR_NAME
 from constants.force import FORCE_CALIBRATION_SAMPLES
 from constants.pzt_rs import PZT_RS_RS_UNITS_LABEL
+from constants.serial import CAPTURE_STOP_DRAIN_MS
 from data_processing.archive_writer import ArchiveWriterThread
 from data_processing.force_state import get_force_runtime_state
 from data_processing.adc_mux_timing import adc_mux_timing_log, calculate_adc_mux_timing_for_acquisition
@@ -214,9 +215,11 @@ class CaptureLifecycleMixin:
         self.is_capturing = True
         if hasattr(self, "update_analysis_availability"):
             self.update_analysis_availability()
+        # The channel layout is fixed for the whole run, so resolve the sweep
+        # width once here instead of on every incoming block.
+        self._capture_samples_per_sweep = self.get_effective_samples_per_sweep()
         if self.serial_thread:
-            expected_samples_per_sweep = self.get_effective_samples_per_sweep()
-            self.serial_thread.set_capturing(True, expected_samples_per_sweep=expected_samples_per_sweep)
+            self.serial_thread.set_capturing(True, expected_samples_per_sweep=self._capture_samples_per_sweep)
 
         time.sleep(0.05)
 
@@ -238,10 +241,39 @@ class CaptureLifecycleMixin:
         self.statusBar().showMessage("Capturing - Scrolling Mode")
 
     def stop_capture(self):
-        """Stop data capture."""
+        """Stop data capture and finalize it before returning."""
+        if not self._halt_capture():
+            return
+
+        self.drain_serial_input(CAPTURE_STOP_DRAIN_MS / 1000.0)
+        self.on_capture_finished()
+
+    def request_stop_capture(self):
+        """Stop data capture from the Stop button without blocking the GUI.
+
+        The wait for in-flight bytes runs on a single-shot timer instead of a
+        sleep, and the capture is finalized when it fires.
+        """
+        if not self._halt_capture():
+            return
+
+        self._capture_stop_pending = True
+        self.stop_btn.setEnabled(False)
+        QTimer.singleShot(CAPTURE_STOP_DRAIN_MS, self.finish_pending_capture_stop)
+
+    def finish_pending_capture_stop(self):
+        """Finalize a capture stopped by request_stop_capture, if still pending."""
+        if not getattr(self, '_capture_stop_pending', False):
+            return
+        self._capture_stop_pending = False
+        self.drain_serial_input(0.0)
+        self.on_capture_finished()
+
+    def _halt_capture(self) -> bool:
+        """Tell the device and reader to stop; return False if not capturing."""
         if not self.is_capturing:
             self.log_status("Stop requested but capture already stopped")
-            return
+            return False
 
         self.log_status("Stopping capture")
 
@@ -261,10 +293,7 @@ class CaptureLifecycleMixin:
         self.is_capturing = False
         if hasattr(self, "update_analysis_availability"):
             self.update_analysis_availability()
-
-        self.drain_serial_input(0.15)
-
-        self.on_capture_finished()
+        return True
 
     def on_capture_finished(self):
         """Handle capture finished (either stopped or timed out)."""
@@ -272,6 +301,7 @@ class CaptureLifecycleMixin:
         timing.capture_end_time = time.time()
 
         self.is_capturing = False
+        self._capture_samples_per_sweep = None
         if hasattr(self, "update_analysis_availability"):
             self.update_analysis_availability()
         get_force_runtime_state(self).start_time = None
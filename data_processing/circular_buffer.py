@@ -68,3 +68,40 @@ def take_recent(buffer: np.ndarray, slices: list[tuple[int, int]]) -> np.ndarray
         start, stop = slices[0]
         return buffer[start:stop].copy()
     return np.concatenate([buffer[start:stop] for start, stop in slices])
+
+
+def write_slices(
+    write_index: int,
+    count: int,
+    capacity: int,
+) -> list[tuple[tuple[int, int], tuple[int, int]]]:
+    """Return ``((dest_start, dest_stop), (src_start, src_stop))`` pairs for a block write.
+
+    Writing ``count`` rows at ``write_index % capacity`` touches at most two
+    contiguous buffer ranges, so a block can be stored with slice assignment
+    instead of a scattered fancy-index write. When the block is longer than the
+    buffer only its trailing ``capacity`` rows survive, matching what a
+    row-by-row write would have left behind.
+    """
+    if capacity <= 0 or count <= 0:
+        return []
+
+    src_start = max(0, int(count) - capacity)
+    kept = int(count) - src_start
+    dest_start = (int(write_index) + src_start) % capacity
+
+    first = min(kept, capacity - dest_start)
+    pairs = [((dest_start, dest_start + first), (src_start, src_start + first))]
+    if first < kept:
+        pairs.append(((0, kept - first), (src_start + first, src_start + kept)))
+    return pairs
+
+
+def put_block(
+    buffer: np.ndarray,
+    slices: list[tuple[tuple[int, int], tuple[int, int]]],
+    block: np.ndarray,
+) -> None:
+    """Copy ``block`` rows into ``buffer`` at the ranges from :func:`write_slices`."""
+    for (dest_start, dest_stop), (src_start, src_stop) in slices:
+        buffer[dest_start:dest_stop] = block[src_start:src_stop]
@@ -72,6 +72,11 @@ def schedule_force_plot_refresh(owner) -> None:
             return
 
     try:
+        # A pending ADC-driven redraw refreshes the force traces too, so there
+        # is no need to arm a second, force-only timer alongside it.
+        plot_update_timer = getattr(owner, "plot_update_timer", None)
+        if plot_update_timer is not None and plot_update_timer.isActive():
+            return
         if not owner.force_plot_timer.isActive():
             owner.force_plot_timer.start(owner.force_plot_debounce_ms)
     except Exception:
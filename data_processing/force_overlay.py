@@ -152,7 +152,7 @@ class ForceOverlayMixin:
             update_viewbox()
 
         try:
-            force_array = np.array(state.data, dtype=np.float64)
+            force_array = np.asarray(state.data, dtype=np.float64)
             force_times = force_array[:, 0]
 
             start_idx = np.searchsorted(force_times, min_time, side='left')
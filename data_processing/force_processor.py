@@ -6,6 +6,8 @@ Handles force sensor data processing and calibration.
 
 import time
 
+import numpy as np
+
 from constants.force import FORCE_CALIBRATION_SAMPLES
 from data_processing.force_feedback import (
     log_first_force_sample,
@@ -37,9 +39,11 @@ class ForceProcessorMixin:
             )
             return False
 
-        baseline_window = recent_samples[-FORCE_CALIBRATION_SAMPLES:]
-        state.calibration_offset['x'] = sum(sample[0] for sample in baseline_window) / FORCE_CALIBRATION_SAMPLES
-        state.calibration_offset['z'] = sum(sample[1] for sample in baseline_window) / FORCE_CALIBRATION_SAMPLES
+        baseline_x, baseline_z = np.mean(
+            np.asarray(recent_samples[-FORCE_CALIBRATION_SAMPLES:], dtype=np.float64), axis=0
+        )
+        state.calibration_offset['x'] = float(baseline_x)
+        state.calibration_offset['z'] = float(baseline_z)
         state.calibrating = False
         state.calibration_samples = {'x': [], 'z': []}
         self.log_status(
@@ -61,12 +65,8 @@ class ForceProcessorMixin:
         if len(state.calibration_samples['x']) < FORCE_CALIBRATION_SAMPLES:
             return True
 
-        state.calibration_offset['x'] = sum(state.calibration_samples['x']) / len(
-            state.calibration_samples['x']
-        )
-        state.calibration_offset['z'] = sum(state.calibration_samples['z']) / len(
-            state.calibration_samples['z']
-        )
+        state.calibration_offset['x'] = float(np.mean(state.calibration_samples['x']))
+        state.calibration_offset['z'] = float(np.mean(state.calibration_samples['z']))
         state.calibrating = False
         log_force_calibration_ready(self, state=state)
         return True
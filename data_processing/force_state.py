@@ -9,17 +9,75 @@ from __future__ import annotations
 import collections
 from dataclasses import dataclass, field
 
+import numpy as np
+
 from constants.force import (
     FORCE_CALIBRATION_SAMPLES,
     MAX_FORCE_SAMPLES,
 )
 
 
+class ForceSampleRing:
+    """Bounded ``(timestamp, x, z)`` force history stored in a preallocated array.
+
+    Behaves like the ``deque(maxlen=...)`` it replaces for appends, length,
+    iteration, and indexing, while ``np.asarray`` returns the ordered samples as
+    a float64 ``(n, 3)`` array without converting each tuple on every redraw.
+    """
+
+    __slots__ = ("_samples", "_write_index", "_count")
+
+    def __init__(self, maxlen: int = MAX_FORCE_SAMPLES):
+        self._samples = np.zeros((max(1, int(maxlen)), 3), dtype=np.float64)
+        self._write_index = 0
+        self._count = 0
+
+    @property
+    def maxlen(self) -> int:
+        return len(self._samples)
+
+    def append(self, sample) -> None:
+        self._samples[self._write_index] = sample
+        self._write_index = (self._write_index + 1) % len(self._samples)
+        if self._count < len(self._samples):
+            self._count += 1
+
+    def clear(self) -> None:
+        self._write_index = 0
+        self._count = 0
+
+    def to_array(self) -> np.ndarray:
+        """Return the stored samples, oldest first, as a new ``(n, 3)`` array."""
+        if self._count < len(self._samples):
+            return self._samples[:self._count].copy()
+        return np.concatenate(
+            (self._samples[self._write_index:], self._samples[:self._write_index])
+        )
+
+    def __array__(self, dtype=None, copy=None):
+        ordered = self.to_array()
+        return ordered if dtype is None else ordered.astype(dtype, copy=False)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self):
+        return (tuple(row) for row in self.to_array().tolist())
+
+    def __getitem__(self, index):
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError("ForceSampleRing indices must be integers")
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("ForceSampleRing index out of range")
+        start = self._write_index - self._count
+        return tuple(self._samples[(start + index) % len(self._samples)].tolist())
+
+
 @dataclass(slots=True)
 class ForceRuntimeState:
-    data: collections.deque = field(
-        default_factory=lambda: collections.deque(maxlen=MAX_FORCE_SAMPLES)
-    )
+    data: ForceSampleRing = field(default_factory=ForceSampleRing)
     start_time: float | None = None
     calibration_offset: dict[str, float] = field(
         default_factory=lambda: {"x": 0.0, "z": 0.0}
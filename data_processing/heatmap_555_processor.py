@@ -20,6 +20,7 @@ from constants.heatmap import (
 from data_processing.circular_buffer import recent_window_slices, take_recent
 from data_processing.heatmap_signal_processing import (
     heatmap_sensor_label_order,
+    render_gaussian_blob,
     resolve_heatmap_blob_sigmas,
 )
 
@@ -122,17 +123,18 @@ class Heatmap555ProcessorMixin:
         if sweeps_array.size == 0:
             return np.empty((0, 0), dtype=np.float64), []
 
-        unique_channels = []
-        for ch in channels:
-            if ch not in unique_channels:
-                unique_channels.append(ch)
+        # One pass groups sequence positions by channel, in first-seen order.
+        channel_positions = {}
+        for position, channel in enumerate(channels):
+            channel_positions.setdefault(channel, []).append(position)
+        unique_channels = list(channel_positions)
 
         if not unique_channels:
             return np.empty((0, 0), dtype=np.float64), []
 
         per_channel_values = []
         for channel in unique_channels:
-            positions = [i for i, c in enumerate(channels) if c == channel]
+            positions = channel_positions[channel]
             if not positions:
                 per_channel_values.append(np.zeros(sweeps_array.shape[0], dtype=np.float64))
                 continue
@@ -349,12 +351,16 @@ class Heatmap555ProcessorMixin:
                 elif tb > lr:
                     sigma_y *= (1.0 + axis_k * min(1.0, tb - lr))
 
-            dx = self.heatmap_x_grid - state['smoothed_x']
-            dy = self.heatmap_y_grid - state['smoothed_y']
-            gaussian = np.exp(-(dx**2 / (2 * sigma_x**2) + dy**2 / (2 * sigma_y**2)))
-
             amplitude = state['smoothed_i'] * float(settings.get('intensity_scale', INTENSITY_SCALE)) * confidence
-            heatmap_now = gaussian * amplitude
+            heatmap_now = render_gaussian_blob(
+                self.heatmap_x_grid,
+                self.heatmap_y_grid,
+                state['smoothed_x'],
+                state['smoothed_y'],
+                sigma_x,
+                sigma_y,
+                amplitude,
+            )
 
             map_alpha = float(settings.get('map_smooth_alpha', R_HEATMAP_MAP_SMOOTH_ALPHA))
             map_alpha = float(np.clip(map_alpha, 0.0, 1.0))
@@ -16,6 +16,7 @@ from constants.heatmap import (
 from data_processing.circular_buffer import recent_window_slices, take_recent
 from data_processing.heatmap_signal_processing import (
     heatmap_sensor_label_order,
+    render_gaussian_blob,
     resolve_heatmap_blob_sigmas,
 )
 
@@ -150,9 +151,6 @@ class PiezoHeatmapProcessorMixin:
 
     def generate_heatmap(self, cop_x, cop_y, intensity, settings, package_index=0):
         """Generate 2D Gaussian heatmap centered at CoP."""
-        dx = self.heatmap_x_grid - cop_x
-        dy = self.heatmap_y_grid - cop_y
-
         sigma_x, sigma_y = resolve_heatmap_blob_sigmas(settings, BLOB_SIGMA_X, BLOB_SIGMA_Y)
         sigma_scale = settings.get('sigma_scale', 1.0)
         sigma_scale_x = settings.get('sigma_scale_x', 1.0)
@@ -163,10 +161,18 @@ class PiezoHeatmapProcessorMixin:
         else:
             sigma_x = max(1e-6, sigma_x * sigma_scale)
             sigma_y = sigma_x
-        gaussian = np.exp(-(dx**2 / (2 * sigma_x**2) + dy**2 / (2 * sigma_y**2)))
 
         amplitude = intensity * settings.get('intensity_scale', INTENSITY_SCALE)
-        self.heatmap_buffers[package_index][:] = gaussian * amplitude
+        render_gaussian_blob(
+            self.heatmap_x_grid,
+            self.heatmap_y_grid,
+            cop_x,
+            cop_y,
+            sigma_x,
+            sigma_y,
+            amplitude,
+            out=self.heatmap_buffers[package_index],
+        )
         np.clip(self.heatmap_buffers[package_index], 0, 1, out=self.heatmap_buffers[package_index])
 
         return self.heatmap_buffers[package_index]
@@ -373,6 +379,9 @@ class PiezoHeatmapProcessorMixin:
         channel_to_baseline = settings.get('channel_to_baseline', {}) if use_time_series_median_baseline else {}
         sensor_labels = self._threshold_label_order()
         package_sensor_values = []
+        channel_positions = {}
+        for position, channel in enumerate(channels):
+            channel_positions.setdefault(channel, []).append(position)
 
         for package_index, group in enumerate(sensor_package_groups):
             package_channels = list(group.get('channels', []))
@@ -383,7 +392,7 @@ class PiezoHeatmapProcessorMixin:
                 if package_positions:
                     positions = [int(package_positions[local_idx])] if local_idx < len(package_positions) else []
                 else:
-                    positions = [i for i, c in enumerate(channels) if c == channel]
+                    positions = channel_positions.get(channel, [])
                 channel_data_list = []
                 for pos in positions:
                     start_idx = pos * repeat_count
@@ -36,11 +36,10 @@ class HeatmapProcessorMixin(PiezoHeatmapProcessorMixin, Heatmap555ProcessorMixin
             for _ in range(MAX_SENSOR_PACKAGES)
         ]
 
-        # Pre-compute coordinate grids for Gaussian blob
-        y_coords = np.linspace(-HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_HEIGHT).reshape(-1, 1)
-        x_coords = np.linspace(-HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_WIDTH).reshape(1, -1)
-        self.heatmap_y_grid = np.tile(y_coords, (1, HEATMAP_WIDTH))
-        self.heatmap_x_grid = np.tile(x_coords, (HEATMAP_HEIGHT, 1))
+        # Pre-compute coordinate axes for the Gaussian blob.  They stay as
+        # (H, 1) and (1, W) vectors and broadcast to the full grid when used.
+        self.heatmap_y_grid = np.linspace(-HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_HEIGHT).reshape(-1, 1)
+        self.heatmap_x_grid = np.linspace(-HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_WIDTH).reshape(1, -1)
 
         self.heatmap_signal_processors = [
             HeatmapSignalProcessor(
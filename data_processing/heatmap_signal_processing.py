@@ -10,6 +10,13 @@ from typing import List, Optional, Tuple
 
 import numpy as np
 
+try:
+    from scipy.signal import lfilter
+
+    SCIPY_HEATMAP_HPF_AVAILABLE = True
+except Exception:
+    SCIPY_HEATMAP_HPF_AVAILABLE = False
+
 # Shared sensor label order for both the piezo and 555 heatmap pipelines.
 HEATMAP_SENSOR_LABEL_ORDER: Tuple[str, ...] = ("T", "B", "R", "L", "C")
 
@@ -30,6 +37,33 @@ def resolve_heatmap_blob_sigmas(settings, default_x: float, default_y: float) ->
     return circular_sigma, circular_sigma
 
 
+def render_gaussian_blob(
+    x_grid,
+    y_grid,
+    center_x: float,
+    center_y: float,
+    sigma_x: float,
+    sigma_y: float,
+    amplitude: float = 1.0,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Return ``amplitude * exp(-dx²/2σx² - dy²/2σy²)`` over an axis-aligned grid.
+
+    The blob is separable, so it is built as the outer product of one row
+    profile and one column profile instead of evaluating ``exp`` per pixel.
+    ``x_grid``/``y_grid`` may be full ``(H, W)`` grids or broadcastable
+    ``(1, W)``/``(H, 1)`` coordinate vectors.
+    """
+    x_axis = np.asarray(x_grid)
+    y_axis = np.asarray(y_grid)
+    x_axis = x_axis[0, :] if x_axis.ndim == 2 else x_axis.reshape(-1)
+    y_axis = y_axis[:, 0] if y_axis.ndim == 2 else y_axis.reshape(-1)
+    x_profile = np.exp(-((x_axis - center_x) ** 2) / (2.0 * sigma_x ** 2))
+    y_profile = np.exp(-((y_axis - center_y) ** 2) / (2.0 * sigma_y ** 2))
+    y_profile *= amplitude
+    return np.multiply.outer(y_profile, x_profile, out=out)
+
+
 class HeatmapSignalProcessor:
     """Process per-channel samples into bias-removed RMS magnitudes."""
 
@@ -90,10 +124,20 @@ class HeatmapSignalProcessor:
         rc = 1.0 / (2.0 * np.pi * self.hpf_cutoff_hz)
         alpha = rc / (rc + dt)
 
-        y = np.empty_like(samples, dtype=np.float64)
         prev_x = self.hpf_prev_x[idx]
         prev_y = self.hpf_prev_y[idx]
 
+        if SCIPY_HEATMAP_HPF_AVAILABLE:
+            # y[n] = alpha * (y[n-1] + x[n] - x[n-1]) as a first-order IIR with
+            # its initial state carried over from the previous window.
+            x = np.asarray(samples, dtype=np.float64)
+            zi = np.array([alpha * (prev_y - prev_x)], dtype=np.float64)
+            y, _ = lfilter([alpha, -alpha], [1.0, -alpha], x, zi=zi)
+            self.hpf_prev_x[idx] = x[-1]
+            self.hpf_prev_y[idx] = y[-1]
+            return y
+
+        y = np.empty_like(samples, dtype=np.float64)
         for i in range(samples.size):
             x = samples[i]
             prev_y = alpha * (prev_y + x - prev_x)
@@ -104,6 +148,18 @@ class HeatmapSignalProcessor:
         self.hpf_prev_y[idx] = prev_y
         return y
 
+    @staticmethod
+    def _rms(samples: np.ndarray, offset: float, remove_negatives: bool) -> float:
+        """Return the RMS of ``samples - offset`` using a single float64 temporary.
+
+        The centered copy is clamped in place and squared-and-summed by ``dot``,
+        so no separate clamp or square arrays are allocated per window.
+        """
+        centered = np.subtract(samples, offset, dtype=np.float64)
+        if remove_negatives:
+            np.maximum(centered, 0.0, out=centered)
+        return float(np.sqrt(np.dot(centered, centered) / centered.size))
+
     def compute_rms(
         self,
         channel_samples: List[np.ndarray],
@@ -121,10 +177,7 @@ class HeatmapSignalProcessor:
                 if samples.size == 0:
                     rms_values.append(0.0)
                     continue
-                centered = samples - self.bias_values[idx]
-                if remove_negatives:
-                    centered = np.maximum(centered, 0.0)
-                rms_values.append(float(np.sqrt(np.mean(centered ** 2))))
+                rms_values.append(self._rms(samples, self.bias_values[idx], remove_negatives))
             return rms_values, self.bias_values.copy()
 
         rms_values = []
@@ -133,9 +186,7 @@ class HeatmapSignalProcessor:
             if filtered.size == 0:
                 rms_values.append(0.0)
                 continue
-            if remove_negatives:
-                filtered = np.maximum(filtered, 0.0)
-            rms_values.append(float(np.sqrt(np.mean(filtered ** 2))))
+            rms_values.append(self._rms(filtered, 0.0, remove_negatives))
 
         return rms_values, self.bias_values.copy()
 
@@ -692,13 +692,25 @@ class PztDecayAnalyzer:
         target_tolerance = max(self.settings.target_tolerance_v, 5.0 * self.baseline_sigma_v)
         plateau_end = None
         plateau: list[PztDecaySample] = []
-        for index in range(len(capture) - final_count - 1, plateau_count - 2, -1):
-            window = list(capture[index - plateau_count + 1:index + 1])
-            values = [sample.voltage_v for sample in window]
-            if (all(abs(value - self.target_voltage_v) <= target_tolerance for value in values)
-                    and max(values) - min(values) <= stable_limit):
-                plateau_end, plateau = index, window
-                break
+        # Score every candidate window at once instead of re-slicing the capture
+        # for each end index: a window qualifies when none of its samples leave
+        # the target band and its peak-to-peak spread stays within the limit.
+        candidates = np.fromiter(
+            (sample.voltage_v for sample in capture[:len(capture) - final_count]),
+            dtype=np.float64,
+        )
+        if plateau_count >= 1 and candidates.size >= plateau_count:
+            outside_band = ~(np.abs(candidates - self.target_voltage_v) <= target_tolerance)
+            outside_counts = np.concatenate(([0], np.cumsum(outside_band)))
+            windows = np.lib.stride_tricks.sliding_window_view(candidates, plateau_count)
+            qualifying = np.flatnonzero(
+                (outside_counts[plateau_count:] == outside_counts[:-plateau_count])
+                & (windows.max(axis=1) - windows.min(axis=1) <= stable_limit)
+            )
+            if qualifying.size:
+                window_start = int(qualifying[-1])
+                plateau_end = window_start + plateau_count - 1
+                plateau = list(capture[window_start:plateau_end + 1])
         if plateau_end is None:
             raise ValueError("could not find a stable plateau immediately before the final release")
 
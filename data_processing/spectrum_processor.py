@@ -532,7 +532,11 @@ class SpectrumProcessorMixin:
         if not hasattr(self, 'visualization_tabs'):
             return
 
-        if self.visualization_tabs.tabText(self.visualization_tabs.currentIndex()) != 'Spectrum':
+        if hasattr(self, 'get_current_visualization_tab_name'):
+            current_tab = self.get_current_visualization_tab_name()
+        else:
+            current_tab = self.visualization_tabs.tabText(self.visualization_tabs.currentIndex())
+        if current_tab != 'Spectrum':
             return
 
         if getattr(self, 'spectrum_frozen', False):
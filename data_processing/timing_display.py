@@ -6,6 +6,7 @@ Owns capture timing state, timing calculations, and 555 timing readouts.
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 import math
 
@@ -14,6 +15,12 @@ from constants.defaults_555 import (
     ANALYZER555_DEFAULT_RB_OHMS,
     ANALYZER555_DEFAULT_RK_OHMS,
 )
+from constants.runtime import MAX_TIMING_SAMPLES
+
+
+def _recent_history():
+    """Return a bounded history that drops its oldest entry once full."""
+    return deque(maxlen=MAX_TIMING_SAMPLES)
 
 
 @dataclass
@@ -26,15 +33,15 @@ class TimingState:
     last_buffer_time: float | None = None
     last_buffer_end_time: float | None = None
     mcu_last_block_end_us: int | None = None
-    buffer_receipt_times: list = field(default_factory=list)
-    buffer_gap_times: list = field(default_factory=list)
-    arduino_sample_times: list = field(default_factory=list)
-    block_sample_counts: list = field(default_factory=list)
-    block_sweeps_counts: list = field(default_factory=list)
-    block_samples_per_sweep: list = field(default_factory=list)
-    mcu_block_start_us: list = field(default_factory=list)
-    mcu_block_end_us: list = field(default_factory=list)
-    mcu_block_gap_us: list = field(default_factory=list)
+    buffer_receipt_times: deque = field(default_factory=_recent_history)
+    buffer_gap_times: deque = field(default_factory=_recent_history)
+    arduino_sample_times: deque = field(default_factory=_recent_history)
+    block_sample_counts: deque = field(default_factory=_recent_history)
+    block_sweeps_counts: deque = field(default_factory=_recent_history)
+    block_samples_per_sweep: deque = field(default_factory=_recent_history)
+    mcu_block_start_us: deque = field(default_factory=_recent_history)
+    mcu_block_end_us: deque = field(default_factory=_recent_history)
+    mcu_block_gap_us: deque = field(default_factory=_recent_history)
     adc_active_capture_duration_us: int = 0
     adc_emitted_sample_count: int = 0
     adc_block_count: int = 0
@@ -65,12 +72,6 @@ class TimingState:
         self.adc_block_gap_total_us = 0
         self.adc_block_gap_count = 0
 
-    def trim_recent(self, attr_name, max_items):
-        """Keep only the newest items in a history list without replacing the list object."""
-        history = getattr(self, attr_name)
-        if len(history) > max_items:
-            del history[:-max_items]
-
 
 class TimingDisplayMixin:
     """Capture timing state, timing label updates, and 555 timing readouts."""
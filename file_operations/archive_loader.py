@@ -107,7 +107,8 @@ class ArchiveLoaderMixin:
     
     def load_archive_data(self):
         """Load all sweep data from archive file for full view.
-        Returns (sweeps_list, timestamps_list) or (None, None) on error.
+        Returns (sweeps_array, timestamps_list) or (None, None) on error.
+        ``sweeps_array`` is a float32 ``(sweeps, samples_per_sweep)`` array.
         """
         if not self._archive_path or not Path(self._archive_path).exists():
             return None, None
@@ -240,7 +241,7 @@ class ArchiveLoaderMixin:
                 )
 
             self.log_status(f"Loaded {len(sweeps)} sweeps from archive")
-            return sweeps_array.tolist(), timestamps
+            return sweeps_array, timestamps
             
         except Exception as e:
             self.log_status(f"ERROR: Failed to load archive: {e}")
@@ -265,10 +266,10 @@ class ArchiveLoaderMixin:
             try:
                 self._finalize_archive_if_active()
                 sweeps, timestamps = self.load_archive_data()
-                if not sweeps or not timestamps:
+                if sweeps is None or len(sweeps) == 0 or not timestamps:
                     self.log_status("WARNING: Full archive unavailable; falling back to buffered data only")
                 else:
-                    self.raw_data = np.asarray(sweeps, dtype=np.float32)
+                    self.raw_data = sweeps
                     self.sweep_timestamps = np.asarray(timestamps, dtype=np.float64)
                     actual_sweeps = len(self.raw_data)
                     self.is_full_view = True
@@ -25,6 +25,9 @@ from file_operations.force_export_alignment import (
 )
 from file_operations.export_metadata import build_vmid_noise_metadata
 
+# Sweeps converted and written per block during CSV export.
+_CSV_EXPORT_CHUNK_SWEEPS = 4096
+
 
 def build_export_row(
     sweep,
@@ -55,6 +58,64 @@ def build_export_row(
     return row
 
 
+def build_export_rows(
+    sweeps,
+    row_times,
+    *,
+    rs_round_indices,
+    export_column_indices,
+    is_555_mode,
+    force_series,
+    export_start_datetime,
+):
+    """Build the CSV rows for a block of sweeps, matching ``build_export_row`` per row.
+
+    Column selection and the ndarray-to-list conversion run once per block
+    instead of once per sweep; only the time/force columns stay per row.
+    """
+    sweeps = np.asarray(sweeps)
+    if sweeps.ndim != 2:
+        return [
+            build_export_row(
+                sweep,
+                row_time,
+                rs_round_indices=rs_round_indices,
+                export_column_indices=export_column_indices,
+                is_555_mode=is_555_mode,
+                force_series=force_series,
+                export_start_datetime=export_start_datetime,
+            )
+            for sweep, row_time in zip(sweeps, row_times)
+        ]
+
+    column_count = sweeps.shape[1]
+    rounded_columns = {
+        index % column_count
+        for index in (rs_round_indices or ())
+        if -column_count <= index < column_count
+    }
+    if export_column_indices:
+        selected_columns = [index for index in export_column_indices if 0 <= index < column_count]
+        values_block = sweeps[:, selected_columns].tolist()
+        round_positions = [
+            position for position, index in enumerate(selected_columns) if index in rounded_columns
+        ]
+    else:
+        values_block = sweeps.tolist()
+        round_positions = sorted(rounded_columns)
+
+    rows = []
+    for row, row_time in zip(values_block, row_times):
+        for position in round_positions:
+            row[position] = round(row[position], 2)
+        row.insert(0, format_export_clock_time(export_start_datetime, row_time))
+        if is_555_mode:
+            row.insert(1, float(row_time if row_time is not None else 0.0))
+        row.extend(get_nearest_force_values(force_series, row_time))
+        rows.append(row)
+    return rows
+
+
 class DataExporterMixin:
     """Mixin class for data export operations."""
 
@@ -380,7 +441,7 @@ class DataExporterMixin:
         export_column_indices: list[int] | None = None,
     ):
         """Stream archived sweeps to CSV, optionally filtering in bounded chunks."""
-        chunk_size = 4096
+        chunk_size = _CSV_EXPORT_CHUNK_SWEEPS
         chunk_sweeps = []
         chunk_row_times = []
         saved_index = 0
@@ -439,17 +500,16 @@ class DataExporterMixin:
 
                 data = self.adc_filter_engine.filter_block(filter_runtime, data.astype(np.float32, copy=True))
 
-            for sweep, row_time in zip(data, chunk_row_times):
-                writer.writerow(build_export_row(
-                    sweep,
-                    row_time,
-                    rs_round_indices=rs_round_indices,
-                    export_column_indices=export_column_indices,
-                    is_555_mode=is_555_mode,
-                    force_series=force_series,
-                    export_start_datetime=export_start_datetime,
-                ))
-                saved_index += 1
+            writer.writerows(build_export_rows(
+                data,
+                chunk_row_times,
+                rs_round_indices=rs_round_indices,
+                export_column_indices=export_column_indices,
+                is_555_mode=is_555_mode,
+                force_series=force_series,
+                export_start_datetime=export_start_datetime,
+            ))
+            saved_index += len(chunk_row_times)
 
             chunk_sweeps = []
             chunk_row_times = []
@@ -709,13 +769,16 @@ class DataExporterMixin:
                         capture_duration_s=capture_duration,
                     )
 
-                    for saved_index, sweep in enumerate(selected_sweeps):
-                        row_time = None
-                        if row_timestamps is not None and saved_index < len(row_timestamps):
-                            row_time = float(row_timestamps[saved_index])
-                        writer.writerow(build_export_row(
-                            sweep,
-                            row_time,
+                    timestamp_count = len(row_timestamps) if row_timestamps is not None else 0
+                    for chunk_start in range(0, len(selected_sweeps), _CSV_EXPORT_CHUNK_SWEEPS):
+                        chunk_sweeps = selected_sweeps[chunk_start:chunk_start + _CSV_EXPORT_CHUNK_SWEEPS]
+                        chunk_row_times = [
+                            float(row_timestamps[index]) if index < timestamp_count else None
+                            for index in range(chunk_start, chunk_start + len(chunk_sweeps))
+                        ]
+                        writer.writerows(build_export_rows(
+                            chunk_sweeps,
+                            chunk_row_times,
                             rs_round_indices=rs_round_indices,
                             export_column_indices=export_column_indices,
                             is_555_mode=is_555_mode,
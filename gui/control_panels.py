@@ -326,7 +326,7 @@ class ControlPanelsMixin:
 
         self.stop_btn = QPushButton("Stop")
         self.stop_btn.setEnabled(False)
-        self.stop_btn.clicked.connect(self.stop_capture)
+        self.stop_btn.clicked.connect(self.request_stop_capture)
         self.stop_btn.setStyleSheet("QPushButton { background-color: #CCCCCC; color: #666666; font-weight: bold; }")
         layout.addWidget(self.stop_btn, 1, 1)
 
@@ -374,6 +374,8 @@ class DisplayPanelsMixin:
             self.timeseries_tab_index,
             PZT_RS_PZT_TAB_NAME if show_rosette else TIME_SERIES_TAB_NAME,
         )
+        # Renaming the current tab does not emit currentChanged.
+        self._current_visualization_tab_name = None
         if hasattr(self, 'update_rosette_channel_list'):
             self.update_rosette_channel_list()
 
@@ -13,6 +13,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
 from constants.ui import (
+    MAX_LOG_LINES,
     NOTES_INPUT_HEIGHT,
     STATUS_TEXT_HEIGHT,
     SWEEP_RANGE_DEFAULT_MAX,
@@ -108,6 +109,8 @@ class FilePanelsMixin:
         self.status_text = QTextEdit()
         self.status_text.setReadOnly(True)
         self.status_text.setMaximumHeight(STATUS_TEXT_HEIGHT)
+        # Let the document drop its oldest lines itself as new ones arrive.
+        self.status_text.document().setMaximumBlockCount(MAX_LOG_LINES)
         font = QFont("Courier", 9)
         self.status_text.setFont(font)
         layout.addWidget(self.status_text)
@@ -30,6 +30,7 @@ from config.channel_utils import unique_channels_in_order
 from data_processing.heatmap_point_tracker import resolve_point_tracking_target
 from data_processing.heatmap_signal_processing import (
     HEATMAP_SENSOR_LABEL_ORDER,
+    render_gaussian_blob,
     resolve_heatmap_blob_sigmas,
 )
 
@@ -166,20 +167,25 @@ class HeatmapPanelMixin:
 
     def _build_point_tracking_heatmap(self, intensity, settings):
         if not hasattr(self, "_tracking_heatmap_x_grid") or not hasattr(self, "_tracking_heatmap_y_grid"):
-            y_coords = np.linspace(-HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_HEIGHT).reshape(-1, 1)
-            x_coords = np.linspace(-HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_WIDTH).reshape(1, -1)
-            self._tracking_heatmap_y_grid = np.tile(y_coords, (1, HEATMAP_WIDTH))
-            self._tracking_heatmap_x_grid = np.tile(x_coords, (HEATMAP_HEIGHT, 1))
+            self._tracking_heatmap_y_grid = np.linspace(
+                -HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_HEIGHT
+            ).reshape(-1, 1)
+            self._tracking_heatmap_x_grid = np.linspace(
+                -HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_WIDTH
+            ).reshape(1, -1)
 
         sigma_x, sigma_y = resolve_heatmap_blob_sigmas(settings, BLOB_SIGMA_X, BLOB_SIGMA_Y)
-        gaussian = np.exp(
-            -(
-                (self._tracking_heatmap_x_grid ** 2) / (2.0 * sigma_x ** 2)
-                + (self._tracking_heatmap_y_grid ** 2) / (2.0 * sigma_y ** 2)
-            )
-        )
         amplitude = float(intensity) * float(settings.get("intensity_scale", INTENSITY_SCALE))
-        return np.clip(gaussian * amplitude, 0.0, 1.0).astype(np.float32)
+        heatmap = render_gaussian_blob(
+            self._tracking_heatmap_x_grid,
+            self._tracking_heatmap_y_grid,
+            0.0,
+            0.0,
+            sigma_x,
+            sigma_y,
+            amplitude,
+        )
+        return np.clip(heatmap, 0.0, 1.0).astype(np.float32)
 
     def _is_display_mirror_enabled(self) -> bool:
         checkbox = getattr(self, "heatmap_mirror_check", None)
@@ -350,6 +350,7 @@ class PztDecayPanelMixin:
             QMessageBox.warning(self, "PZT decay", "PZT_Decay_Calc requires an Array_PZT_PZR dual-MUX device."); return
         try:
             mapping = self._selected_pzt_decay_mapping(); settings = self._pzt_decay_settings(); settings.validate()
+            self.finish_pending_capture_stop()
             if self.is_capturing: self.stop_capture()
             self._pzt_decay_config_snapshot = self.config.copy()
             self._pzt_decay_control_snapshot = {"buffer": self.buffer_spin.value() if hasattr(self, "buffer_spin") else 1}
@@ -386,6 +387,7 @@ class PztDecayPanelMixin:
             self._pzt_decay_dense_sampling_active = False
             self._pzt_decay_next_burst_index = 0
             self.adc_mux_timing = timing; self.is_capturing = True
+            self._capture_samples_per_sweep = self.get_effective_samples_per_sweep()
             if self.serial_thread: self.serial_thread.set_capturing(True, expected_samples_per_sweep=2 * initial_repeat_count)
             self.send_command("run")
             self._pzt_decay_watchdog.start()
@@ -445,6 +447,7 @@ class PztDecayPanelMixin:
                 raise RuntimeError("device did not acknowledge 'stop' before dense PZT sampling")
             if self.serial_thread:
                 self.serial_thread.set_capturing(False)
+            self._capture_samples_per_sweep = None
             if hasattr(self, "drain_serial_input"):
                 self.drain_serial_input(0.02)
             ok, _ = self.send_command_and_wait_ack(
@@ -473,6 +476,7 @@ class PztDecayPanelMixin:
             self._pzt_decay_previous_repeat = None
             self._pzt_decay_next_burst_index = 0
             self._pzt_decay_last_sample_monotonic = time.monotonic()
+            self._capture_samples_per_sweep = self.get_effective_samples_per_sweep()
             if self.serial_thread:
                 self.serial_thread.set_capturing(True, expected_samples_per_sweep=2 * repeat_count)
             self.send_command("run")
@@ -496,11 +500,12 @@ class PztDecayPanelMixin:
         repeat_count = timing.repeat_count
         last_column = input_index + 2 * (repeat_count - 1)
         if block_samples.ndim != 2 or block_samples.shape[1] <= last_column: return
+        vref_voltage = float(self.get_vref_voltage())
         for sweep, timestamp in zip(block_samples, sweep_timestamps_s):
             burst_index = self._pzt_decay_next_burst_index
             state = self.pzt_decay_analyzer.state
             for repeat_index in range(repeat_count):
-                voltage = float(sweep[input_index + 2 * repeat_index]) / 4095.0 * float(self.get_vref_voltage())
+                voltage = float(sweep[input_index + 2 * repeat_index]) / 4095.0 * vref_voltage
                 previous_state = self.pzt_decay_analyzer.state
                 state = self.pzt_decay_analyzer.add_sample(
                     voltage, float(timestamp), burst_index=burst_index, repeat_index=repeat_index,
@@ -679,7 +684,7 @@ class PztDecayPanelMixin:
             try: self.send_command_and_wait_ack("stop", None, timeout=0.3, max_retries=1)
             except Exception: pass
         if self.serial_thread: self.serial_thread.set_capturing(False)
-        self.is_capturing = False
+        self.is_capturing = False; self._capture_samples_per_sweep = None
         snapshot = self._pzt_decay_config_snapshot
         if snapshot is not None:
             self.config.update({key: getattr(snapshot, key) for key in snapshot.__dataclass_fields__})
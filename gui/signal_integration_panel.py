@@ -2650,7 +2650,7 @@ class PressureMapPanelMixin:
             self._set_signal_integration_curve_data(
                 curve_key,
                 f"{package_id} total force",
-                pg.mkPen(color=color, width=SIGNAL_INTEGRATION_PLOT_LINE_WIDTH),
+                self._get_plot_pen(color, SIGNAL_INTEGRATION_PLOT_LINE_WIDTH),
                 times,
                 total_force_series,
             )
@@ -3202,7 +3202,7 @@ class PressureMapPanelMixin:
 
             channel_data, channel_times, _latest_value = prepared_series
             color = PLOT_COLORS[spec["color_slot"] % len(PLOT_COLORS)]
-            pen = pg.mkPen(color=color, width=SIGNAL_INTEGRATION_PLOT_LINE_WIDTH)
+            pen = self._get_plot_pen(color, SIGNAL_INTEGRATION_PLOT_LINE_WIDTH)
             curve_key = ("signal_integration_rosette", spec["key"])
             desired_curve_keys.add(curve_key)
             self._set_signal_integration_curve_data(curve_key, spec["label"], pen, channel_times, channel_data)
@@ -3225,19 +3225,18 @@ class PressureMapPanelMixin:
             channel_times_2d = channel_times[:num_samples * repeat_count].reshape(-1, repeat_count)
 
             # Only two distinct pens are ever used here, and neither depends on
-            # repeat_idx, so build them once instead of once per repeat per frame.
-            # setPen copies the pen, so sharing these prototypes is safe.
-            primary_pen = pg.mkPen(color=color, width=SIGNAL_INTEGRATION_PLOT_LINE_WIDTH)
+            # repeat_idx; both come from the shared pen cache.
+            primary_pen = self._get_plot_pen(color, SIGNAL_INTEGRATION_PLOT_LINE_WIDTH)
             repeat_pen = None
             if repeat_count > 1:
                 lighter_color = tuple(
                     int(component * SIGNAL_INTEGRATION_DIMMED_COLOR_FRACTION)
                     for component in color
                 )
-                repeat_pen = pg.mkPen(
-                    color=lighter_color,
-                    width=SIGNAL_INTEGRATION_REPEAT_LINE_WIDTH,
-                    style=Qt.PenStyle.DashLine,
+                repeat_pen = self._get_plot_pen(
+                    lighter_color,
+                    SIGNAL_INTEGRATION_REPEAT_LINE_WIDTH,
+                    Qt.PenStyle.DashLine,
                 )
 
             for repeat_idx in range(repeat_count):
@@ -3277,10 +3276,10 @@ class PressureMapPanelMixin:
                 channel_data = np.mean(channel_data_2d, axis=1)
                 channel_times = channel_times_2d[:, 0]
                 name = f"{spec['label']} (avg)"
-                pen = pg.mkPen(
-                    color=color,
-                    width=SIGNAL_INTEGRATION_AVERAGE_LINE_WIDTH,
-                    style=Qt.PenStyle.DashLine,
+                pen = self._get_plot_pen(
+                    color,
+                    SIGNAL_INTEGRATION_AVERAGE_LINE_WIDTH,
+                    Qt.PenStyle.DashLine,
                 )
                 curve_key = ("signal_integration_avg", spec["key"], 0)
             except Exception as exc:
@@ -3289,7 +3288,7 @@ class PressureMapPanelMixin:
                 return False
         else:
             name = spec["label"]
-            pen = pg.mkPen(color=color, width=SIGNAL_INTEGRATION_PLOT_LINE_WIDTH)
+            pen = self._get_plot_pen(color, SIGNAL_INTEGRATION_PLOT_LINE_WIDTH)
             curve_key = ("signal_integration_single", spec["key"], 0)
 
         desired_curve_keys.add(curve_key)
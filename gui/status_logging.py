@@ -6,7 +6,10 @@ GUI-owned status text logging helpers.
 
 from __future__ import annotations
 
-from datetime import datetime
+import time
+from collections import deque
+
+from PyQt6.QtGui import QTextCursor
 
 from constants.ui import MAX_LOG_LINES
 
@@ -14,15 +17,59 @@ from constants.ui import MAX_LOG_LINES
 class StatusLoggingMixin:
     """Own the status text widget update behavior."""
 
+    def _status_timestamp(self) -> str:
+        """Return the local wall-clock time as ``HH:MM:SS.mmm``.
+
+        The ``HH:MM:SS`` part only changes once a second, so it is formatted
+        once per second and reused for every line logged within it.
+        """
+        now = time.time()
+        whole_seconds = int(now)
+        if whole_seconds != getattr(self, '_status_timestamp_second', None):
+            self._status_timestamp_second = whole_seconds
+            self._status_timestamp_prefix = time.strftime("%H:%M:%S", time.localtime(whole_seconds))
+        milliseconds = int((now - whole_seconds) * 1000)
+        return f"{self._status_timestamp_prefix}.{milliseconds:03d}"
+
     def log_status(self, message: str):
-        """Append a timestamped message and keep the log bounded."""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        self.status_text.append(f"[{timestamp}] {message}")
-
-        current_text = self.status_text.toPlainText()
-        lines = current_text.split('\n')
-        if len(lines) > MAX_LOG_LINES:
-            self.status_text.setPlainText('\n'.join(lines[-MAX_LOG_LINES:]))
+        """Queue a timestamped message for the next batched widget update."""
+        timestamp = self._status_timestamp()
+        pending = getattr(self, '_pending_status_lines', None)
+        if pending is None:
+            pending = deque(maxlen=MAX_LOG_LINES)
+            self._pending_status_lines = pending
+        pending.append(f"[{timestamp}] {message}")
+
+        flush_timer = getattr(self, 'status_log_flush_timer', None)
+        if flush_timer is None:
+            self.flush_status_log()
+        elif not flush_timer.isActive():
+            flush_timer.start()
+
+    def flush_status_log(self):
+        """Append all queued messages in one update.
+
+        Each message is inserted as its own plain-text line inside a single
+        edit block, so text that looks like HTML is shown verbatim. The
+        widget's document is capped at ``MAX_LOG_LINES`` blocks when it is
+        built, so Qt drops the oldest lines itself; the full log text is never
+        read back or rebuilt here.
+        """
+        pending = getattr(self, '_pending_status_lines', None)
+        if not pending:
+            return
+        document = self.status_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        needs_break = not document.isEmpty()
+        for line in pending:
+            if needs_break:
+                cursor.insertBlock()
+            cursor.insertText(line)
+            needs_break = True
+        cursor.endEditBlock()
+        pending.clear()
 
         self.status_text.verticalScrollBar().setValue(
             self.status_text.verticalScrollBar().maximum()
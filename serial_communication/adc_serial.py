@@ -153,6 +153,7 @@ class ADCSerialMixin:
         self._serial_disconnect_in_progress = True
 
         try:
+            self.finish_pending_capture_stop()
             if self.is_capturing:
                 self.stop_capture()
 
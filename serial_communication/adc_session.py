@@ -6,21 +6,30 @@ Owns the ADC serial port transport, reader thread wiring, and routed text waits.
 
 from __future__ import annotations
 
+import random
 import time
 
 import serial
-from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtCore import QCoreApplication, Qt
 
 from constants.serial import (
+    ADC_LINE_WAIT_POLL_SEC,
     ARDUINO_RESET_DELAY,
     BAUD_RATE,
     COMMAND_TERMINATOR,
+    CONFIG_RETRY_BACKOFF_CAP_SEC,
     CONFIG_RETRY_DELAY,
     SERIAL_TIMEOUT,
 )
 from serial_communication.serial_threads import SerialReaderThread
 
 
+def retry_backoff_delay(retry_index: int) -> float:
+    """Return a full-jitter exponential backoff delay for the given retry (1-based)."""
+    ceiling = CONFIG_RETRY_DELAY * (2 ** max(0, retry_index - 1))
+    return random.uniform(0.0, min(CONFIG_RETRY_BACKOFF_CAP_SEC, ceiling))
+
+
 class ADCSessionController:
     """Controller for ADC serial-port transport and request/response waits."""
 
@@ -53,9 +62,12 @@ class ADCSessionController:
 
             self.clear_line_waiters()
             thread = SerialReaderThread(port)
-            thread.data_received.connect(self.on_text_line)
-            thread.binary_sweep_received.connect(self.on_binary_sweep)
-            thread.error_occurred.connect(self.on_error)
+            # Reader signals always cross into the GUI thread; say so explicitly
+            # rather than relying on AutoConnection's per-emit thread check.
+            queued = Qt.ConnectionType.QueuedConnection
+            thread.data_received.connect(self.on_text_line, queued)
+            thread.binary_blocks_received.connect(self.on_binary_blocks, queued)
+            thread.error_occurred.connect(self.on_error, queued)
             thread.start()
         except Exception:
             # Leave no open port or running thread behind: a leaked port stays
@@ -100,6 +112,11 @@ class ADCSessionController:
         self.clear_line_waiters()
         return warnings
 
+    def on_binary_blocks(self, blocks):
+        """Hand each block from one reader pass to the sweep handler in order."""
+        for samples, avg_sample_time_us, block_start_us, block_end_us in blocks:
+            self.on_binary_sweep(samples, avg_sample_time_us, block_start_us, block_end_us)
+
     # ------------------------------------------------------------------
     # Routed ADC text handling
     # ------------------------------------------------------------------
@@ -132,24 +149,30 @@ class ADCSessionController:
         return consumed
 
     def wait_for_line(self, matcher, timeout: float, *, consume: bool = False, send_action=None):
-        """Wait for a routed ADC text line while keeping Qt responsive."""
+        """Wait for a routed ADC text line while keeping Qt responsive.
+
+        The reply is checked right after each event pump, which is where the
+        reader's queued line is delivered, so a match returns without first
+        sitting out a poll sleep.
+        """
         waiter = {
             "matcher": matcher,
             "consume": consume,
             "matched_line": None,
         }
         self._adc_line_waiters.append(waiter)
-        deadline = time.time() + timeout
+        deadline = time.monotonic() + timeout
 
         try:
             if send_action is not None:
                 send_action()
-            while time.time() < deadline:
-                if waiter["matched_line"] is not None:
-                    return waiter["matched_line"]
+            while waiter["matched_line"] is None:
+                if time.monotonic() >= deadline:
+                    return None
                 QCoreApplication.processEvents()
-                time.sleep(0.01)
-            return None
+                if waiter["matched_line"] is None:
+                    time.sleep(ADC_LINE_WAIT_POLL_SEC)
+            return waiter["matched_line"]
         finally:
             if waiter in self._adc_line_waiters:
                 self._adc_line_waiters.remove(waiter)
@@ -166,20 +189,30 @@ class ADCSessionController:
             return False, line[7:].strip() if len(line) > 7 else None
         return None
 
+    @staticmethod
+    def encode_command(command: str) -> bytes:
+        return f"{command}{COMMAND_TERMINATOR}".encode("utf-8")
+
     def send_command(self, command: str):
-        if not self.serial_port or not self.serial_port.is_open:
+        self.send_command_bytes(self.encode_command(command))
+
+    def send_command_bytes(self, payload: bytes):
+        port = self.serial_port
+        if not port or not port.is_open:
             raise RuntimeError("Not connected to serial port")
-        self.serial_port.write(f"{command}{COMMAND_TERMINATOR}".encode("utf-8"))
-        self.serial_port.flush()
+        port.write(payload)
+        port.flush()
 
     def send_command_and_wait_ack(self, command: str, expected_value: str, timeout: float, max_retries: int):
         if not self.serial_port or not self.serial_port.is_open:
             return False, None
 
+        # Encoded once; every retry resends the same bytes.
+        payload = self.encode_command(command)
         for attempt in range(max_retries):
             try:
                 if attempt > 0:
-                    time.sleep(CONFIG_RETRY_DELAY)
+                    time.sleep(retry_backoff_delay(attempt))
                     self.serial_port.reset_input_buffer()
                     self.serial_port.reset_output_buffer()
 
@@ -187,7 +220,7 @@ class ADCSessionController:
                     lambda text: text.startswith("#OK") or text.startswith("#NOT_OK"),
                     timeout,
                     consume=True,
-                    send_action=lambda: self.send_command(command),
+                    send_action=lambda: self.send_command_bytes(payload),
                 )
                 if line is None:
                     if attempt >= max_retries - 1:
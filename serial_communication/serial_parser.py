@@ -5,6 +5,43 @@ Handles parsing of ASCII serial messages from Arduino.
 """
 
 
+# Arduino reference names -> the reference command values in config['reference'].
+VREF_STATUS_TO_COMMAND = {
+    'INTERNAL1V2': '1.2',
+    'VDD': 'vdd',
+    '1V2': '1.2',
+    '3V3': 'vdd',
+}
+
+
+def _parse_status_bool(value: str) -> bool:
+    return value.lower() == 'true'
+
+
+def _parse_status_reference(value: str) -> str:
+    return VREF_STATUS_TO_COMMAND.get(value, value.lower())
+
+
+# Firmware status field name -> (ArduinoStatus attribute, value parser).
+# Keys are the leading identifier of the status line, so annotated forms such
+# as "# osr (high-speed): 4" resolve to 'osr'.
+STATUS_FIELD_PARSERS = {
+    'repeatCount': ('repeat', int),
+    'groundPin': ('ground_pin', int),
+    'useGroundBeforeEach': ('use_ground', _parse_status_bool),
+    'osr': ('osr', int),
+    'gain': ('gain', int),
+    'adcReference': ('reference', _parse_status_reference),
+    'reference': ('reference', _parse_status_reference),
+}
+
+
+def _status_field_name(key: str) -> str:
+    """Return the identifier before any space or '(' annotation in a status key."""
+    name = key.strip('# ').partition('(')[0]
+    return name.partition(' ')[0]
+
+
 class SerialParserMixin:
     """Mixin for parsing ASCII serial data."""
     
@@ -14,11 +51,10 @@ class SerialParserMixin:
             return
 
         if line.startswith('#'):
-            # Log all status messages
+            # Log all status messages; parse_status_line ignores lines that
+            # carry no status field, so it needs no pre-filter here.
             self.log_status(line)
-            # Parse status lines when not in configuration mode
-            if 'STATUS' in line or ':' in line or (line.startswith('#   ') and ',' in line):
-                self.parse_status_line(line)
+            self.parse_status_line(line)
         else:
             # Only log if it's printable ASCII (not binary data that got through)
             if line.strip() and line.isprintable():
@@ -27,38 +63,21 @@ class SerialParserMixin:
     def parse_status_line(self, line: str):
         """Parse a single line from Arduino status output."""
         try:
-            # Parse channels: "#   1,2,3,4,5"
-            if line.startswith('#   ') and ',' in line and not ':' in line:
-                channels_str = line[4:].strip()
-                channels = [int(c.strip()) for c in channels_str.split(',')]
-                self.arduino_status.channels = channels
+            key, separator, value = line.partition(':')
+            if not separator:
+                # Parse channels: "#   1,2,3,4,5"
+                if line.startswith('#   ') and ',' in line:
+                    channels_str = line[4:].strip()
+                    channels = [int(c.strip()) for c in channels_str.split(',')]
+                    self.arduino_status.channels = channels
+                return
+
+            # Parse other fields: "# key: value", dispatched on the key's identifier.
+            field_parser = STATUS_FIELD_PARSERS.get(_status_field_name(key))
+            if field_parser is None:
                 return
-            
-            # Parse other fields
-            if ':' in line:
-                parts = line.split(':', 1)
-                key = parts[0].strip('# ').strip()
-                value = parts[1].strip()
-                
-                if 'repeatCount' in key:
-                    self.arduino_status.repeat = int(value)
-                elif 'groundPin' in key:
-                    self.arduino_status.ground_pin = int(value)
-                elif 'useGroundBeforeEach' in key:
-                    self.arduino_status.use_ground = (value.lower() == 'true')
-                elif 'osr' in key.lower():
-                    self.arduino_status.osr = int(value)
-                elif 'gain' in key.lower():
-                    self.arduino_status.gain = int(value)
-                elif 'adcReference' in key or 'reference' in key.lower():
-                    # Map Arduino reference names back to our format
-                    ref_map = {
-                        'INTERNAL1V2': '1.2',
-                        'VDD': 'vdd',
-                        '1V2': '1.2',
-                        '3V3': 'vdd'
-                    }
-                    self.arduino_status.reference = ref_map.get(value, value.lower())
+            attribute, parse_value = field_parser
+            setattr(self.arduino_status, attribute, parse_value(value.strip()))
         except (ValueError, IndexError):
             # Malformed firmware status output: ignore this line rather than
             # letting it break the reader. Anything else is a real defect and
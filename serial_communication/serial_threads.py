@@ -5,6 +5,7 @@ Background threads for reading serial data without blocking the GUI.
 """
 
 import re
+import struct
 import time
 
 import numpy as np
@@ -23,12 +24,18 @@ from constants.serial import (
     SERIAL_PACKET_SPAN_MIN_FACTOR,
     SERIAL_PACKET_SPAN_TOLERANCE_US,
     SERIAL_READER_DEBUG_LOG_LIMIT,
-    SERIAL_READER_IDLE_MS,
 )
 
 
 FORCE_NUMERIC_TOKEN_RE = re.compile(r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?")
 
+# Little-endian packet fields, decoded straight out of the receive bytearray.
+# unpack_from only borrows the buffer for the call, so the consumed-prefix
+# trim at the end of each parse pass stays legal.
+BINARY_SAMPLE_COUNT = struct.Struct('<H')
+BINARY_PACKET_FOOTER = struct.Struct('<HII')  # avg_sample_time_us, block_start_us, block_end_us
+ASCII_LINE_START = ord('#')
+
 
 def parse_force_sensor_line(line: str):
     """Parse a force-sensor line into ``(x_force, z_force)`` floats.
@@ -69,7 +76,9 @@ def parse_force_sensor_line(line: str):
 class SerialReaderThread(QThread):
     """Background thread for reading serial data without blocking the GUI."""
     data_received = pyqtSignal(str)
-    binary_sweep_received = pyqtSignal(object, object, object, object)  # samples (np.ndarray uint16), avg_sample_time_us, block_start_us, block_end_us
+    # One emission per parse pass: list of (samples uint16 ndarray,
+    # avg_sample_time_us, block_start_us, block_end_us) tuples in arrival order.
+    binary_blocks_received = pyqtSignal(object)
     error_occurred = pyqtSignal(str)
 
     def __init__(self, serial_port):
@@ -88,30 +97,40 @@ class SerialReaderThread(QThread):
         self._last_idle_log_time = 0.0
 
     def run(self):
-        """Continuously read from serial port and emit signals."""
+        """Continuously read from serial port and emit signals.
+
+        Blocks in ``read(1)`` (bounded by the port timeout) until a byte
+        arrives, then drains everything already waiting, so an idle port costs
+        no polling wakeups and new packets are picked up as soon as they land.
+        """
+        port = self.serial_port
+        if not port or not port.is_open:
+            return
+        # A port closed underneath us makes read() raise, which ends the loop
+        # below, so is_open does not need re-checking on every pass.
+        read = port.read
+        monotonic = time.monotonic
+
         while self.running:
             try:
-                if self.serial_port and self.serial_port.is_open:
-                    bytes_waiting = self.serial_port.in_waiting
-                    if bytes_waiting > 0:
-                        data = self.serial_port.read(bytes_waiting)
-                        self._last_data_time = time.monotonic()
-                        
-                        # Always process as binary buffer to handle mixed binary/ASCII data
-                        # This prevents "Unexpected ASCII" errors when MCU sends binary packets
-                        self.binary_buffer.extend(data)
-                        self.binary_buffer = self.process_binary_data(self.binary_buffer)
-                        # Data was available, keep draining aggressively without artificial delay.
-                        continue
-
+                data = read(1)
+                if not data:
                     self._maybe_emit_capture_idle_debug()
-                else:
-                    break
+                    continue
 
-                self.msleep(SERIAL_READER_IDLE_MS)  # Keep reads responsive at higher channel counts
+                bytes_waiting = port.in_waiting
+                if bytes_waiting > 0:
+                    data += read(bytes_waiting)
+                self._last_data_time = monotonic()
+
+                # Always process as binary buffer to handle mixed binary/ASCII data
+                # This prevents "Unexpected ASCII" errors when MCU sends binary packets
+                self.binary_buffer.extend(data)
+                self.binary_buffer = self.process_binary_data(self.binary_buffer)
 
             except Exception as e:
-                self.error_occurred.emit(f"Serial read error: {e}")
+                if self.running:
+                    self.error_occurred.emit(f"Serial read error: {e}")
                 break
 
     def process_binary_data(self, buffer):
@@ -129,10 +148,16 @@ class SerialReaderThread(QThread):
         Samples are parsed with ``numpy.frombuffer`` (zero-copy, no Python loop)
         and emitted as a ``numpy.ndarray`` of dtype ``uint16``.
 
+        Consecutive blocks accepted during one pass are emitted together
+        through ``binary_blocks_received``, so a read that drains several
+        packets queues a single cross-thread event instead of one per packet.
+        An ASCII line between packets splits the batch to keep wire order.
+
         If not capturing, binary packets are discarded (but not logged as errors).
         """
         buf_start = 0
         buf_len = len(buffer)
+        accepted_blocks = []
 
         while buf_start <= buf_len - 2:
             b0 = buffer[buf_start]
@@ -145,7 +170,7 @@ class SerialReaderThread(QThread):
                 if buf_len - buf_start < SERIAL_PACKET_HEADER_BYTES:
                     break  # Need more data for header
 
-                sample_count = buffer[buf_start + 2] | (buffer[buf_start + 3] << 8)
+                (sample_count,) = BINARY_SAMPLE_COUNT.unpack_from(buffer, buf_start + 2)
                 expected = self.expected_samples_per_sweep
 
                 if sample_count <= 0:
@@ -192,30 +217,13 @@ class SerialReaderThread(QThread):
                             f"Binary packet accepted: sample_count={sample_count}, expected_multiple={expected}, packet_size={packet_size}"
                         )
 
-                    # --- Parse samples with frombuffer (no Python loop) ---
                     payload_start = buf_start + SERIAL_PACKET_HEADER_BYTES
                     payload_end = payload_start + sample_count * 2
-                    # .copy() so the array owns its data before buffer is trimmed below
-                    samples = np.frombuffer(
-                        memoryview(buffer)[payload_start:payload_end], dtype='<u2'
-                    ).copy()
-
-                    # avg_sample_time_us: uint16 LE, 2 bytes after payload
-                    avg_time_offset = payload_end
-                    avg_sample_time_us = int.from_bytes(
-                        buffer[avg_time_offset:avg_time_offset + SERIAL_PACKET_AVG_SAMPLE_TIME_BYTES], 'little'
-                    )
 
-                    # block_start_us / block_end_us: uint32 LE, 4 bytes each
-                    # Use int.from_bytes (copies bytes immediately) instead of
-                    # np.frombuffer so no memoryview holds a live export on the
-                    # bytearray at the point of the del buffer[:n] trim below.
-                    ts_offset = avg_time_offset + SERIAL_PACKET_AVG_SAMPLE_TIME_BYTES
-                    block_start_us = int.from_bytes(
-                        buffer[ts_offset:ts_offset + 4], 'little'
-                    )
-                    block_end_us = int.from_bytes(
-                        buffer[ts_offset + 4:ts_offset + 8], 'little'
+                    # Footer right after the payload: avg_sample_time_us (uint16 LE),
+                    # then block_start_us / block_end_us (uint32 LE each).
+                    avg_sample_time_us, block_start_us, block_end_us = BINARY_PACKET_FOOTER.unpack_from(
+                        buffer, payload_end
                     )
 
                     if not self._is_packet_timing_sane(
@@ -235,8 +243,17 @@ class SerialReaderThread(QThread):
                         buf_start += 1
                         continue
 
-                    self.binary_sweep_received.emit(
-                        samples, avg_sample_time_us, block_start_us, block_end_us
+                    # --- Parse samples with frombuffer (no Python loop) ---
+                    # Only packets that passed the timing check pay for the copy.
+                    # Read straight from the bytearray by offset/count, then
+                    # .copy() so the array owns its data before the buffer is
+                    # trimmed below.
+                    samples = np.frombuffer(
+                        buffer, dtype='<u2', count=sample_count, offset=payload_start
+                    ).copy()
+
+                    accepted_blocks.append(
+                        (samples, avg_sample_time_us, block_start_us, block_end_us)
                     )
 
                 buf_start += packet_size
@@ -245,10 +262,9 @@ class SerialReaderThread(QThread):
             # ----------------------------------------------------------------
             # ASCII message (lines starting with '#')
             # ----------------------------------------------------------------
-            if b0 == ord('#'):
-                try:
-                    newline_idx = buffer.index(ord('\n'), buf_start)
-                except ValueError:
+            if b0 == ASCII_LINE_START:
+                newline_idx = buffer.find(b'\n', buf_start)
+                if newline_idx < 0:
                     # Terminator has not arrived yet. Wait for the rest of the line
                     # instead of consuming the '#', which would destroy a line split
                     # across two reads. Resync only once the unterminated tail grows
@@ -259,8 +275,13 @@ class SerialReaderThread(QThread):
                     continue
 
                 try:
-                    line = bytes(buffer[buf_start:newline_idx]).decode('utf-8', errors='strict').strip()
+                    line = buffer[buf_start:newline_idx].decode('utf-8', errors='strict').strip()
                     if line and line.isprintable():
+                        # Deliver blocks parsed ahead of this line first so the
+                        # GUI sees packets and status lines in wire order.
+                        if accepted_blocks:
+                            self.binary_blocks_received.emit(accepted_blocks)
+                            accepted_blocks = []
                         self.data_received.emit(line)
                     buf_start = newline_idx + 1
                     continue
@@ -271,8 +292,12 @@ class SerialReaderThread(QThread):
                     buf_start += 1
                     continue
 
-            # Unknown byte — skip to resync
-            buf_start += 1
+            # Unknown byte — jump straight to the next possible packet or line
+            # start instead of stepping through the noise one byte at a time.
+            buf_start = self._next_sync_candidate(buffer, buf_start + 1, buf_len)
+
+        if accepted_blocks:
+            self.binary_blocks_received.emit(accepted_blocks)
 
         # Trim all consumed bytes from the buffer in a single operation.
         if buf_start > 0:
@@ -280,6 +305,22 @@ class SerialReaderThread(QThread):
 
         return buffer
 
+    @staticmethod
+    def _next_sync_candidate(buffer, start, buf_len):
+        """Return the offset of the next 0xAA or '#' at or after ``start``.
+
+        When neither byte appears, stop one byte short of the end so a trailing
+        0xAA can still pair with a 0x55 that arrives in the next read.
+        """
+        candidates = [
+            index
+            for index in (buffer.find(b'\xAA', start), buffer.find(b'#', start))
+            if index >= 0
+        ]
+        if candidates:
+            return min(candidates)
+        return max(start, buf_len - 1)
+
     def set_capturing(self, capturing, expected_samples_per_sweep=None):
         """Set whether we're currently capturing data."""
         self.is_capturing = capturing
@@ -341,8 +382,14 @@ class SerialReaderThread(QThread):
         self.binary_buffer.clear()
 
     def stop(self):
-        """Stop the thread."""
+        """Stop the thread, waking it from a pending blocking read."""
         self.running = False
+        cancel_read = getattr(self.serial_port, "cancel_read", None)
+        if cancel_read is not None:
+            try:
+                cancel_read()
+            except Exception:
+                pass
 
 
 class ForceReaderThread(QThread):
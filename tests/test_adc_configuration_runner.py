@@ -1,6 +1,8 @@
-import time
+import threading
 import unittest
 
+from PyQt6.QtCore import Qt
+
 from config.adc_configuration_runner import ADCConfigurationRunner
 
 
@@ -37,18 +39,22 @@ class ADCConfigurationRunnerTests(unittest.TestCase):
         serial_port = FakeSerialPort()
         service = FakeService([FakeResult(False), FakeResult(True)])
         runner = ADCConfigurationRunner(service)
+        outcomes = []
+        done = threading.Event()
+
+        def on_finished(outcome):
+            outcomes.append(outcome)
+            done.set()
 
+        # Direct: there is no event loop here to deliver a queued call.
+        runner.finished.connect(on_finished, Qt.ConnectionType.DirectConnection)
         started = runner.start(serial_port, request={"channels": [1, 2]}, max_attempts=2)
         self.assertTrue(started)
 
-        deadline = time.time() + 1.0
-        outcome = None
-        while time.time() < deadline and outcome is None:
-            outcome = runner.take_outcome()
-            time.sleep(0.01)
-
-        self.assertIsNotNone(outcome)
-        self.assertTrue(outcome.success)
+        self.assertTrue(done.wait(1.0))
+        self.assertEqual(len(outcomes), 1)
+        self.assertTrue(outcomes[0].success)
+        self.assertFalse(runner.is_running)
         self.assertEqual(len(service.requests), 2)
         self.assertEqual(serial_port.input_reset_count, 1)
         self.assertEqual(serial_port.output_reset_count, 1)
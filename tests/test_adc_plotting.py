@@ -2,6 +2,7 @@ import unittest
 import threading
 
 import numpy as np
+from PyQt6.QtCore import Qt
 
 from data_processing.adc_plotting import ADCPlottingMixin
 
@@ -135,6 +136,20 @@ class ADCPlottingTests(unittest.TestCase):
         np.testing.assert_array_equal(data, np.array([[30], [40], [50]], dtype=np.float32))
         np.testing.assert_array_equal(timestamps, np.array([12.0, 13.0, 14.0], dtype=np.float64))
 
+    def test_ordered_snapshot_limits_to_requested_recent_sweeps(self):
+        harness = ADCPlottingHarness()
+        harness.sweep_count = 7
+        harness.buffer_write_index = 7
+        harness._active_data_buffer = np.array(
+            [[60], [70], [30], [40], [50]], dtype=np.float32
+        )
+        harness.sweep_timestamps_buffer = np.array([15.0, 16.0, 12.0, 13.0, 14.0], dtype=np.float64)
+
+        data, timestamps, _ = harness._get_ordered_active_buffer_snapshot(recent_sweeps=3)
+
+        np.testing.assert_array_equal(data, np.array([[50], [60], [70]], dtype=np.float32))
+        np.testing.assert_array_equal(timestamps, np.array([14.0, 15.0, 16.0], dtype=np.float64))
+
     def test_get_live_plot_filter_snapshot_includes_history_for_warmup(self):
         harness = ADCPlottingHarness()
         harness.window_size_spin = DummySpinBox(2)
@@ -264,6 +279,155 @@ class ADCPlottingTests(unittest.TestCase):
         np.testing.assert_allclose(channel_times, timestamps, rtol=1e-6, atol=1e-6)
         self.assertAlmostEqual(latest_value, expected_delta_v, places=6)
 
+    def test_prepare_channel_plot_series_decimates_without_losing_latest_value(self):
+        harness = ADCPlottingHarness()
+        spec = {"key": ("adc", 1), "sample_indices": [1, 3], "label": "CH1"}
+        data = np.arange(40 * 4, dtype=np.float32).reshape(40, 4)
+        timestamps = np.arange(40, dtype=np.float64) * 0.01
+
+        channel_data, channel_times, latest_value = harness._prepare_channel_plot_series(
+            spec,
+            data,
+            timestamps,
+            avg_sample_time_sec=0.001,
+            max_samples_per_series=25,
+        )
+
+        full_data = data[:, [1, 3]].reshape(-1)
+        full_times = (timestamps.reshape(-1, 1) + np.array([0.001, 0.003]).reshape(1, -1)).reshape(-1)
+        positions = ADCPlottingMixin._m4_sample_positions(full_data, 25 // 4)
+        self.assertLessEqual(len(channel_data), 25)
+        np.testing.assert_allclose(channel_data, full_data[positions])
+        np.testing.assert_allclose(channel_times, full_times[positions])
+        self.assertEqual(latest_value, float(full_data[-1]))
+
+    def test_plot_pens_are_shared_per_color_width_and_style(self):
+        harness = ADCPlottingHarness()
+
+        solid = harness._get_plot_pen((255, 0, 0), 2)
+        dashed = harness._get_plot_pen((255, 0, 0), 3, Qt.PenStyle.DashLine)
+
+        self.assertIs(harness._get_plot_pen((255, 0, 0), 2), solid)
+        self.assertIsNot(dashed, solid)
+        self.assertEqual(dashed.style(), Qt.PenStyle.DashLine)
+        self.assertEqual(solid.widthF(), 2.0)
+
+    def test_curve_pen_is_only_reapplied_when_the_cached_pen_changes(self):
+        class PenRecordingCurve:
+            def __init__(self):
+                self.pens = []
+
+            def setPen(self, pen):
+                self.pens.append(pen)
+
+        harness = ADCPlottingHarness()
+        curve = PenRecordingCurve()
+        solid = harness._get_plot_pen((255, 0, 0), 2)
+        dashed = harness._get_plot_pen((255, 0, 0), 3, Qt.PenStyle.DashLine)
+
+        ADCPlottingMixin._apply_curve_pen(curve, solid)
+        ADCPlottingMixin._apply_curve_pen(curve, harness._get_plot_pen((255, 0, 0), 2))
+        ADCPlottingMixin._apply_curve_pen(curve, dashed)
+
+        self.assertEqual(curve.pens, [solid, dashed])
+
+    def test_prepare_channel_plot_series_decimation_keeps_single_sample_spikes(self):
+        harness = ADCPlottingHarness()
+        spec = {"key": ("adc", 0), "sample_indices": [0], "label": "CH0"}
+        data = np.zeros((1000, 1), dtype=np.float32)
+        data[437, 0] = 900.0
+        data[611, 0] = -300.0
+        timestamps = np.arange(1000, dtype=np.float64) * 0.01
+
+        channel_data, channel_times, _latest_value = harness._prepare_channel_plot_series(
+            spec,
+            data,
+            timestamps,
+            avg_sample_time_sec=0.0,
+            max_samples_per_series=100,
+        )
+
+        self.assertLessEqual(len(channel_data), 100)
+        self.assertEqual(float(channel_data.max()), 900.0)
+        self.assertEqual(float(channel_data.min()), -300.0)
+        self.assertTrue(np.all(np.diff(channel_times) > 0))
+
+    def test_prepare_channel_plot_series_decimation_keeps_repeat_columns_aligned(self):
+        harness = ADCPlottingHarness()
+        repeat_count = 3
+        spec = {"key": ("adc", 0), "sample_indices": [0, 1, 2], "label": "CH0"}
+        data = np.tile(np.array([10.0, 20.0, 30.0], dtype=np.float32), (1000, 1))
+        data[437] = [910.0, 920.0, 930.0]
+        timestamps = np.arange(1000, dtype=np.float64) * 0.01
+
+        channel_data, channel_times, _latest_value = harness._prepare_channel_plot_series(
+            spec,
+            data,
+            timestamps,
+            avg_sample_time_sec=0.001,
+            max_samples_per_series=120,
+            repeat_count=repeat_count,
+        )
+
+        self.assertLessEqual(len(channel_data), 120)
+        self.assertEqual(len(channel_data) % repeat_count, 0)
+        columns = channel_data.reshape(-1, repeat_count)
+        np.testing.assert_array_equal(columns - columns[:, :1], np.tile([0.0, 10.0, 20.0], (len(columns), 1)))
+        self.assertIn(930.0, columns[:, 2])
+        time_columns = channel_times.reshape(-1, repeat_count)
+        np.testing.assert_allclose(np.diff(time_columns, axis=1), 0.001)
+
+    def test_pixel_limited_sample_budget_caps_at_four_points_per_pixel(self):
+        class SizedWidget:
+            def __init__(self, width):
+                self._width = width
+
+            def width(self):
+                return self._width
+
+        budget = ADCPlottingMixin._pixel_limited_sample_budget
+        self.assertEqual(budget(SizedWidget(800), 12000), 3200)
+        self.assertEqual(budget(SizedWidget(4000), 12000), 12000)
+        self.assertEqual(budget(SizedWidget(0), 12000), 12000)
+        self.assertEqual(budget(object(), 12000), 12000)
+
+    def test_prepare_channel_plot_series_uses_precomputed_display_settings(self):
+        harness = ADCPlottingHarness()
+        harness.yaxis_units_combo = DummyComboBox("Voltage")
+        harness.active_sensor_reverse_polarity = True
+        display_settings = harness._get_series_display_settings()
+        harness.yaxis_units_combo = None
+        harness.active_sensor_reverse_polarity = False
+        spec = {"key": ("adc", 0), "sample_indices": [0], "label": "CH0"}
+        data = np.array([[0.0], [4095.0]], dtype=np.float32)
+        timestamps = np.array([0.0, 0.001], dtype=np.float64)
+
+        channel_data, _channel_times, latest_value = harness._prepare_channel_plot_series(
+            spec,
+            data,
+            timestamps,
+            avg_sample_time_sec=0.0,
+            max_samples_per_series=100,
+            display_settings=display_settings,
+        )
+
+        np.testing.assert_allclose(channel_data, np.array([0.0, -3.3]), atol=1e-6)
+        self.assertAlmostEqual(latest_value, -3.3, places=6)
+
+    def test_selected_plot_channels_are_cached_until_invalidated(self):
+        harness = ADCPlottingHarness()
+        first = DummyCheckBox(True)
+        second = DummyCheckBox(False)
+        harness.channel_checkboxes = {("adc", 1): first, ("adc", 2): second}
+
+        self.assertEqual(harness._get_selected_plot_channels(), {("adc", 1)})
+
+        second.setChecked(True)
+        self.assertEqual(harness._get_selected_plot_channels(), {("adc", 1)})
+
+        harness._invalidate_selected_plot_channels(2)
+        self.assertEqual(harness._get_selected_plot_channels(), {("adc", 1), ("adc", 2)})
+
     def test_capture_current_plot_baselines_uses_median_window_value(self):
         harness = ADCPlottingHarness()
         harness.sweep_count = 3
@@ -2,10 +2,10 @@ import unittest
 from unittest import mock
 
 from config.mcu_detector import MCUDetectorMixin
-from constants.serial import COMMAND_TERMINATOR
+from constants.serial import COMMAND_TERMINATOR, CONFIG_RETRY_BACKOFF_CAP_SEC, CONFIG_RETRY_DELAY
 from serial_communication import adc_session as adc_session_module
 from serial_communication.adc_serial import ADCSerialMixin
-from serial_communication.adc_session import ADCSessionController
+from serial_communication.adc_session import ADCSessionController, retry_backoff_delay
 
 
 class FakeLabel:
@@ -90,6 +90,27 @@ class AdcSerialRoutingTests(unittest.TestCase):
         self.assertEqual(harness.serial_port.writes, [f"gain 42{COMMAND_TERMINATOR}".encode("utf-8")])
         self.assertEqual(harness.adc_session._adc_line_waiters, [])
 
+    def test_wait_for_line_returns_reply_delivered_by_event_pump_without_sleeping(self):
+        session = ADCSessionController(lambda line: None, lambda *args: None, lambda message: None)
+        sleeps = []
+
+        def deliver_reply():
+            session.handle_text_line("#OK 7")
+
+        with mock.patch.object(adc_session_module.QCoreApplication, "processEvents", deliver_reply), \
+                mock.patch.object(adc_session_module.time, "sleep", sleeps.append):
+            line = session.wait_for_line(lambda text: text.startswith("#OK"), 1.0, consume=True)
+
+        self.assertEqual(line, "#OK 7")
+        self.assertEqual(sleeps, [])
+        self.assertEqual(session._adc_line_waiters, [])
+
+    def test_retry_backoff_delay_uses_capped_exponential_full_jitter(self):
+        with mock.patch.object(adc_session_module.random, "uniform", lambda low, high: (low, high)):
+            self.assertEqual(retry_backoff_delay(1), (0.0, CONFIG_RETRY_DELAY))
+            self.assertEqual(retry_backoff_delay(3), (0.0, CONFIG_RETRY_DELAY * 4))
+            self.assertEqual(retry_backoff_delay(30), (0.0, CONFIG_RETRY_BACKOFF_CAP_SEC))
+
     def test_detect_mcu_uses_routed_adc_lines(self):
         harness = DummyAdcRouting()
 
@@ -93,7 +93,7 @@ class ArchiveIoTests(unittest.TestCase):
             loader = DummyArchiveLoader(archive_path)
             sweeps, timestamps = loader.load_archive_data()
 
-            self.assertEqual(sweeps, [[1, 2], [3, 4]])
+            self.assertEqual(sweeps.tolist(), [[1, 2], [3, 4]])
             self.assertEqual(timestamps, [0.0, 0.5])
 
     def test_archive_loader_keeps_embedded_timestamps_despite_unknown_entry(self):
@@ -116,7 +116,7 @@ class ArchiveIoTests(unittest.TestCase):
             sweeps, timestamps = loader.load_archive_data()
 
             # One junk record must not discard the real per-sweep timestamps.
-            self.assertEqual(sweeps, [[1, 2], [3, 4]])
+            self.assertEqual(sweeps.tolist(), [[1, 2], [3, 4]])
             self.assertEqual(timestamps, [1.0, 2.0])
             self.assertTrue(any("unsupported entries" in msg for msg in loader.log_messages))
 
@@ -145,7 +145,7 @@ class ArchiveIoTests(unittest.TestCase):
             loader = DummyArchiveLoader(archive_path, timing_path)
             sweeps, timestamps = loader.load_archive_data()
 
-            self.assertEqual(sweeps, [[11, 12], [21, 22]])
+            self.assertEqual(sweeps.tolist(), [[11, 12], [21, 22]])
             self.assertEqual(timestamps, [0.0, 0.0002])
             self.assertFalse(hasattr(loader, "first_sweep_timestamp_us"))
 
@@ -168,7 +168,7 @@ class ArchiveIoTests(unittest.TestCase):
             loader = DummyArchiveLoader(archive_path)
             sweeps, timestamps = loader.load_archive_data()
 
-            self.assertEqual(sweeps, [[11, 12], [21, 22], [31, 32]])
+            self.assertEqual(sweeps.tolist(), [[11, 12], [21, 22], [31, 32]])
             self.assertEqual(timestamps, [0, 1, 2])
 
     def test_finalize_archive_logs_writer_failure(self):
@@ -1,3 +1,4 @@
+import io
 import threading
 import unittest
 from unittest.mock import patch
@@ -51,7 +52,6 @@ class BinaryStatusHarness(BinaryProcessorMixin):
         self.logged = []
         self._timing_state = type('TimingStateObj', (), {
             'buffer_receipt_times': [],
-            'trim_recent': lambda *args, **kwargs: None,
             'arduino_sample_times': [],
             'mcu_block_start_us': [],
             'mcu_block_end_us': [],
@@ -130,5 +130,54 @@ class BinaryStatusTests(unittest.TestCase):
         self.assertEqual(harness.signal_update_count, 0)
 
 
+    def test_pinned_capture_width_skips_layout_lookup(self):
+        harness = BinaryStatusHarness()
+        harness._capture_samples_per_sweep = 5
+
+        def fail_lookup():
+            raise AssertionError("sweep width should come from the pinned capture value")
+
+        harness.get_effective_samples_per_sweep = fail_lookup
+        samples = np.arange(10, dtype=np.uint16)
+
+        harness.process_binary_sweep(samples, avg_sample_time_us=100, block_start_us=1000, block_end_us=1900)
+
+        self.assertEqual(harness.sweep_count, 60002)
+        self.assertEqual(harness.timing_state.adc_block_count, 1)
+
+    def test_block_timing_sidecar_reuses_one_csv_writer(self):
+        harness = BinaryStatusHarness()
+        harness._block_timing_file = io.StringIO()
+        harness._block_timing_write_count = 0
+        samples = np.arange(10, dtype=np.uint16)
+
+        harness.process_binary_sweep(samples, avg_sample_time_us=100, block_start_us=1000, block_end_us=1900)
+        first_writer = harness._block_timing_csv[1]
+        harness.process_binary_sweep(samples, avg_sample_time_us=100, block_start_us=2000, block_end_us=2900)
+
+        self.assertIs(harness._block_timing_csv[1], first_writer)
+        rows = harness._block_timing_file.getvalue().splitlines()
+        self.assertEqual(rows[0].split(',')[:6], ['10', '5', '2', '100', '1000', '1900'])
+        self.assertEqual(rows[1].split(',')[4:6], ['2000', '2900'])
+
+    def test_steady_state_block_takes_buffer_lock_once(self):
+        harness = BinaryStatusHarness()
+        acquisitions = []
+
+        class CountingLock:
+            def __enter__(self):
+                acquisitions.append(1)
+
+            def __exit__(self, *exc_info):
+                return False
+
+        harness.buffer_lock = CountingLock()
+        samples = np.arange(10, dtype=np.uint16)
+
+        harness.process_binary_sweep(samples, avg_sample_time_us=100, block_start_us=1000, block_end_us=1900)
+
+        self.assertEqual(len(acquisitions), 1)
+        self.assertEqual(harness.sweep_count, 60002)
+
 if __name__ == '__main__':
     unittest.main()
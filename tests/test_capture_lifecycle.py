@@ -1,5 +1,7 @@
 import unittest
+from unittest import mock
 
+from data_processing import capture_lifecycle as capture_lifecycle_module
 from data_processing.capture_lifecycle import CaptureLifecycleMixin
 
 
@@ -57,5 +59,58 @@ class CaptureLifecycleTests(unittest.TestCase):
         self.assertTrue(harness.window_size_spin.enabled)
 
 
+class StopCaptureHarness(CaptureLifecycleMixin):
+    def __init__(self):
+        self.is_capturing = True
+        self.serial_thread = None
+        self.stop_btn = FakeControl()
+        self.events = []
+
+    def log_status(self, message):
+        pass
+
+    def send_command_and_wait_ack(self, command, expected_value=None, timeout=0.0, max_retries=1):
+        self.events.append(("send", command))
+        return True, None
+
+    def drain_serial_input(self, duration):
+        self.events.append(("drain", duration))
+
+    def on_capture_finished(self):
+        self.events.append(("finished",))
+
+
+class StopCaptureTests(unittest.TestCase):
+    def test_requested_stop_defers_drain_and_finish_to_a_timer(self):
+        harness = StopCaptureHarness()
+        scheduled = []
+
+        with mock.patch.object(
+            capture_lifecycle_module.QTimer,
+            "singleShot",
+            lambda delay, callback: scheduled.append((delay, callback)),
+        ):
+            harness.request_stop_capture()
+
+        self.assertFalse(harness.is_capturing)
+        self.assertFalse(harness.stop_btn.enabled)
+        self.assertEqual(harness.events, [("send", "stop")])
+        self.assertEqual([delay for delay, _callback in scheduled], [capture_lifecycle_module.CAPTURE_STOP_DRAIN_MS])
+
+        scheduled[0][1]()
+        harness.finish_pending_capture_stop()
+        self.assertEqual(harness.events, [("send", "stop"), ("drain", 0.0), ("finished",)])
+
+    def test_stop_capture_still_finishes_before_returning(self):
+        harness = StopCaptureHarness()
+
+        harness.stop_capture()
+
+        self.assertEqual(
+            harness.events,
+            [("send", "stop"), ("drain", capture_lifecycle_module.CAPTURE_STOP_DRAIN_MS / 1000.0), ("finished",)],
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,7 +12,12 @@ import unittest
 import numpy as np
 
 from data_processing.adc_plotting import ADCPlottingMixin
-from data_processing.circular_buffer import recent_window_slices, take_recent
+from data_processing.circular_buffer import (
+    put_block,
+    recent_window_slices,
+    take_recent,
+    write_slices,
+)
 
 
 CAPACITY = 8
@@ -144,5 +149,46 @@ class RecentWindowSlicesTests(unittest.TestCase):
         np.testing.assert_array_equal(taken, snapshot)
 
 
+class WriteSlicesTests(unittest.TestCase):
+    """Slice-based block writes must match the scattered modulo write they replace."""
+
+    def test_slice_write_matches_fancy_index_write(self):
+        for write_index in range(0, CAPACITY * 2):
+            for count in range(0, CAPACITY * 2 + 2):
+                with self.subTest(write_index=write_index, count=count):
+                    block = np.arange(count, dtype=np.float32) + 100.0
+                    expected = np.zeros(CAPACITY, dtype=np.float32)
+                    for offset, value in enumerate(block):
+                        expected[(write_index + offset) % CAPACITY] = value
+
+                    actual = np.zeros(CAPACITY, dtype=np.float32)
+                    put_block(actual, write_slices(write_index, count, CAPACITY), block)
+
+                    np.testing.assert_array_equal(actual, expected)
+
+    def test_slices_are_contiguous_and_at_most_two(self):
+        self.assertEqual(write_slices(3, 0, CAPACITY), [])
+        self.assertEqual(write_slices(3, 4, CAPACITY), [((3, 7), (0, 4))])
+        self.assertEqual(
+            write_slices(6, 4, CAPACITY),
+            [((6, 8), (0, 2)), ((0, 2), (2, 4))],
+        )
+
+    def test_written_block_reads_back_through_recent_window(self):
+        data = np.zeros((CAPACITY, SAMPLES_PER_SWEEP), dtype=np.float32)
+        write_index = 0
+        for block_sweeps in (3, 4, 5, 2):
+            block = np.repeat(
+                np.arange(write_index, write_index + block_sweeps, dtype=np.float32)[:, None],
+                SAMPLES_PER_SWEEP,
+                axis=1,
+            )
+            put_block(data, write_slices(write_index, block_sweeps, CAPACITY), block)
+            write_index += block_sweeps
+
+        slices = recent_window_slices(write_index, write_index, 5, CAPACITY)
+        self.assertEqual(take_recent(data, slices)[:, 0].tolist(), _expected_tail(write_index, 5))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -12,7 +12,7 @@ import numpy as np
 
 from data_processing.adc_filter_engine import ADCFilterEngine, SCIPY_FILTERS_AVAILABLE
 from data_processing.filter_processor import FilterProcessorMixin
-from file_operations.data_exporter import DataExporterMixin
+from file_operations.data_exporter import DataExporterMixin, build_export_row, build_export_rows
 from file_operations.export_metadata import build_analysis_export_metadata
 
 
@@ -308,6 +308,41 @@ class AnalysisExportMetadataTests(unittest.TestCase):
         self.assertEqual(metadata["analysis_export"]["csv"]["exported_traces"], ["CH0", "Calculated Force - CH0 [N]"])
 
 
+class ExportRowBlockTests(unittest.TestCase):
+    def test_block_rows_match_per_sweep_rows(self):
+        sweeps = np.array(
+            [[1.0, 2.125, 3.5, 4.0], [5.0, 6.333, 7.0, 8.0], [9.0, 10.0, 11.75, 12.0]],
+            dtype=np.float32,
+        )
+        row_times = [0.0, 0.5, None]
+        start = datetime(2024, 1, 2, 3, 4, 5)
+        cases = [
+            dict(rs_round_indices=[1, 2], export_column_indices=[3, 1, 9], is_555_mode=False),
+            dict(rs_round_indices=[1], export_column_indices=None, is_555_mode=True),
+            dict(rs_round_indices=[], export_column_indices=[0, 2], is_555_mode=False),
+        ]
+        for case in cases:
+            with self.subTest(**case):
+                expected = [
+                    build_export_row(
+                        sweep,
+                        row_time,
+                        force_series=None,
+                        export_start_datetime=start,
+                        **case,
+                    )
+                    for sweep, row_time in zip(sweeps, row_times)
+                ]
+                actual = build_export_rows(
+                    sweeps,
+                    row_times,
+                    force_series=None,
+                    export_start_datetime=start,
+                    **case,
+                )
+                self.assertEqual(actual, expected)
+
+
 @unittest.skipUnless(SCIPY_FILTERS_AVAILABLE, "SciPy not available")
 class DataExporterTests(unittest.TestCase):
     def test_export_prefers_fullest_available_source_over_short_archive_cache(self):
@@ -19,13 +19,25 @@ class FakeCheckbox:
         self.checked = False
         self.style = ""
         self.stateChanged = FakeSignal()
+        self.signals_blocked = False
+        self.emitted_while_unblocked = 0
+
+    def blockSignals(self, blocked):
+        previous = self.signals_blocked
+        self.signals_blocked = bool(blocked)
+        return previous
 
     def setChecked(self, checked):
+        if bool(checked) != self.checked and not self.signals_blocked:
+            self.emitted_while_unblocked += 1
         self.checked = bool(checked)
 
     def setStyleSheet(self, style):
         self.style = style
 
+    def deleteLater(self):
+        pass
+
 
 class FakeLayout:
     def __init__(self):
@@ -34,6 +46,21 @@ class FakeLayout:
     def addWidget(self, widget, row, col):
         self.widgets.append((widget, row, col))
 
+    def count(self):
+        return len(self.widgets)
+
+    def takeAt(self, index):
+        widget, _row, _col = self.widgets.pop(index)
+        return FakeLayoutItem(widget)
+
+
+class FakeLayoutItem:
+    def __init__(self, widget):
+        self._widget = widget
+
+    def widget(self):
+        return self._widget
+
 
 class FakePort:
     def __init__(self, is_open):
@@ -47,10 +74,22 @@ class ForceCheckboxHarness(ConfigurationMixin):
         self.force_x_checkbox = None
         self.force_z_checkbox = None
         self.triggered = 0
+        self.invalidated = 0
+        self.channel_checkboxes = {}
+        self.config = {'channels': []}
 
     def trigger_plot_update(self):
         self.triggered += 1
 
+    def _invalidate_selected_plot_channels(self, *_args):
+        self.invalidated += 1
+
+    def get_display_channel_specs(self):
+        return [{'key': ('adc', channel), 'label': f"CH{channel}"} for channel in self.config['channels']]
+
+    def update_rosette_channel_list(self):
+        pass
+
 
 class ForceChannelCheckboxTests(unittest.TestCase):
     def test_add_force_channel_checkboxes_only_when_force_port_is_connected(self):
@@ -87,6 +126,44 @@ class ForceChannelCheckboxTests(unittest.TestCase):
         self.assertFalse(harness.force_x_checkbox.checked)
         self.assertFalse(harness.force_z_checkbox.checked)
 
+    def test_select_all_channels_refreshes_plot_once_with_signals_blocked(self):
+        harness = ForceCheckboxHarness()
+        harness.channel_checkboxes = {index: FakeCheckbox(f"CH{index}") for index in range(4)}
+        harness.force_x_checkbox = FakeCheckbox("X Force [N]")
+
+        harness.select_all_channels()
+
+        widgets = [*harness.channel_checkboxes.values(), harness.force_x_checkbox]
+        self.assertTrue(all(widget.checked for widget in widgets))
+        self.assertTrue(all(widget.emitted_while_unblocked == 0 for widget in widgets))
+        self.assertFalse(any(widget.signals_blocked for widget in widgets))
+        self.assertEqual(harness.invalidated, 1)
+        self.assertEqual(harness.triggered, 1)
+
+    def test_update_channel_list_rebuilds_only_when_checkbox_layout_changes(self):
+        harness = ForceCheckboxHarness()
+        harness.config['channels'] = [1, 2]
+
+        with patch("PyQt6.QtWidgets.QCheckBox", FakeCheckbox):
+            harness.update_channel_list()
+            first_build = dict(harness.channel_checkboxes)
+            first_build[('adc', 1)].setChecked(False)
+
+            harness.update_channel_list()
+            self.assertEqual(harness.channel_checkboxes, first_build)
+            self.assertFalse(harness.channel_checkboxes[('adc', 1)].checked)
+
+            harness.force_serial_port = FakePort(is_open=True)
+            harness.update_channel_list()
+            self.assertIsNot(harness.channel_checkboxes[('adc', 1)], first_build[('adc', 1)])
+            self.assertEqual(len(harness.channel_checkboxes_layout.widgets), 4)
+
+            harness.config['channels'] = [1, 2, 3]
+            harness.update_channel_list()
+
+        self.assertEqual(list(harness.channel_checkboxes), [('adc', 1), ('adc', 2), ('adc', 3)])
+        self.assertEqual(len(harness.channel_checkboxes_layout.widgets), 5)
+
     def test_force_checkbox_refs_reset_when_layout_rebuilds(self):
         harness = ForceCheckboxHarness()
         harness.force_x_checkbox = FakeCheckbox("X Force [N]")
@@ -108,6 +108,19 @@ class ForceProcessorTests(unittest.TestCase):
         self.assertEqual(len(harness.force_data), 1)
         self.assertEqual(harness.force_plot_timer.started, [])
 
+    def test_force_samples_skip_force_timer_while_plot_update_is_pending(self):
+        harness = ForceProcessorHarness()
+        harness.is_capturing = True
+        harness.force_start_time = 5.0
+        harness.plot_update_timer = FakeTimer()
+        harness.plot_update_timer.active = True
+
+        with patch("data_processing.force_processor.time.time", return_value=12.0):
+            harness.process_force_data(11.0, 22.0)
+
+        self.assertEqual(len(harness.force_data), 1)
+        self.assertEqual(harness.force_plot_timer.started, [])
+
     def test_force_status_label_updates_on_interval_boundary(self):
         harness = ForceProcessorHarness()
         harness.force_calibration_offset = {'x': 0.0, 'z': 0.0}
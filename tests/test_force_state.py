@@ -1,8 +1,11 @@
 import collections
 import unittest
 
+import numpy as np
+
 from data_processing.force_state import (
     ForceRuntimeState,
+    ForceSampleRing,
     build_default_force_runtime_state,
     get_force_runtime_state,
 )
@@ -25,7 +28,8 @@ class ForceStateTests(unittest.TestCase):
         state = build_default_force_runtime_state()
 
         self.assertIsInstance(state, ForceRuntimeState)
-        self.assertIsInstance(state.data, collections.deque)
+        self.assertIsInstance(state.data, ForceSampleRing)
+        self.assertEqual(len(state.data), 0)
         self.assertIsNone(state.start_time)
         self.assertEqual(state.calibration_offset, {"x": 0.0, "z": 0.0})
         self.assertFalse(state.calibrating)
@@ -59,6 +63,21 @@ class ForceStateTests(unittest.TestCase):
         self.assertEqual(harness._force_selected_port_text, "COM20 - USB Serial Device")
         self.assertEqual(list(harness.force_data), [(0.1, 1.0, 2.0)])
 
+    def test_force_sample_ring_keeps_newest_samples_in_order(self):
+        ring = ForceSampleRing(maxlen=3)
+        for index in range(5):
+            ring.append((float(index), index + 10.0, index + 20.0))
+
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(ring[0], (2.0, 12.0, 22.0))
+        self.assertEqual(ring[-1], (4.0, 14.0, 24.0))
+        self.assertEqual(list(ring), [(2.0, 12.0, 22.0), (3.0, 13.0, 23.0), (4.0, 14.0, 24.0)])
+        np.testing.assert_array_equal(np.asarray(ring)[:, 0], [2.0, 3.0, 4.0])
+
+        ring.clear()
+        self.assertFalse(ring)
+        self.assertEqual(np.asarray(ring).shape, (0, 3))
+
 
 if __name__ == "__main__":
     unittest.main()
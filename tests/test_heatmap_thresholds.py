@@ -7,7 +7,7 @@ from constants.heatmap import HEATMAP_COORD_EXTENT, HEATMAP_HEIGHT, HEATMAP_WIDT
 from data_processing.heatmap_555_processor import Heatmap555ProcessorMixin
 from data_processing.heatmap_piezo_processor import PiezoHeatmapProcessorMixin
 from data_processing.heatmap_point_tracker import resolve_point_tracking_target
-from data_processing.heatmap_signal_processing import HeatmapSignalProcessor
+from data_processing.heatmap_signal_processing import HeatmapSignalProcessor, render_gaussian_blob
 from gui.heatmap_panel import HeatmapPanelMixin
 
 
@@ -302,6 +302,33 @@ class HeatmapThresholdTests(unittest.TestCase):
         self.assertAlmostEqual(full_rms[0], np.sqrt(12.5))
         self.assertAlmostEqual(positive_rms[0], np.sqrt(4.5))
 
+    def test_filtered_rms_clamps_without_touching_input_samples(self):
+        processor = HeatmapSignalProcessor(channel_count=1, bias_duration_sec=2.0, hpf_cutoff_hz=0.0)
+        samples = np.asarray([1.0, 5.0, 3.0, -1.0], dtype=np.float32)
+        original = samples.copy()
+
+        rms, _ = processor.compute_rms([samples], "hpf", 1000.0, 3.0, remove_negatives=True)
+
+        # Mean-removed window is [-1, 3, 1, -3]; only 3 and 1 survive the clamp.
+        self.assertAlmostEqual(rms[0], np.sqrt(10.0 / 4.0))
+        np.testing.assert_array_equal(samples, original)
+
+    def test_high_pass_filter_carries_state_across_windows(self):
+        processor = HeatmapSignalProcessor(channel_count=1, bias_duration_sec=1.0, hpf_cutoff_hz=5.0)
+        rng = np.random.default_rng(7)
+        windows = [rng.normal(500.0, 50.0, size=size) for size in (40, 1, 120)]
+        alpha = (1.0 / (2.0 * np.pi * 5.0)) / ((1.0 / (2.0 * np.pi * 5.0)) + 1.0 / 1000.0)
+
+        filtered = np.concatenate([processor._high_pass_filter(window, 1000.0, 0) for window in windows])
+
+        expected = []
+        prev_x = prev_y = 0.0
+        for x in np.concatenate(windows):
+            prev_y = alpha * (prev_y + x - prev_x)
+            prev_x = x
+            expected.append(prev_y)
+        np.testing.assert_allclose(filtered, expected, rtol=1e-9, atol=1e-9)
+
     def test_piezo_heatmap_blob_uses_columns_for_left_right_motion(self):
         settings = {
             "smooth_alpha": 1.0,
@@ -365,6 +392,28 @@ class HeatmapThresholdTests(unittest.TestCase):
 
         self.assertFalse(np.allclose(heatmap, heatmap.T, rtol=1e-5, atol=1e-6))
 
+    def test_separable_gaussian_blob_matches_dense_formula(self):
+        y_coords = np.linspace(-HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_HEIGHT).reshape(-1, 1)
+        x_coords = np.linspace(-HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_WIDTH).reshape(1, -1)
+        y_grid = np.tile(y_coords, (1, HEATMAP_WIDTH))
+        x_grid = np.tile(x_coords, (HEATMAP_HEIGHT, 1))
+        expected = 0.8 * np.exp(-((x_grid - 0.3) ** 2 / (2 * 0.2 ** 2) + (y_grid + 0.4) ** 2 / (2 * 0.6 ** 2)))
+
+        dense = render_gaussian_blob(x_grid, y_grid, 0.3, -0.4, 0.2, 0.6, 0.8)
+        broadcast = render_gaussian_blob(x_coords, y_coords, 0.3, -0.4, 0.2, 0.6, 0.8)
+
+        np.testing.assert_allclose(dense, expected, rtol=1e-12, atol=1e-12)
+        np.testing.assert_allclose(broadcast, expected, rtol=1e-12, atol=1e-12)
+
+    def test_555_channel_matrix_averages_repeated_channel_positions(self):
+        processor = Dummy555Processor()
+        sweeps = np.array([[1.0, 10.0, 3.0, 20.0], [5.0, 30.0, 7.0, 40.0]])
+
+        matrix, unique_channels = processor._build_channel_matrix(sweeps, [4, 2, 4, 1], 1)
+
+        self.assertEqual(unique_channels, [4, 2, 1])
+        np.testing.assert_allclose(matrix, [[2.0, 10.0, 20.0], [6.0, 30.0, 40.0]])
+
     def test_555_circular_blob_mode_ignores_axis_adaptation(self):
         processor = Dummy555Processor()
         coordinates = np.linspace(-HEATMAP_COORD_EXTENT, HEATMAP_COORD_EXTENT, HEATMAP_WIDTH)
@@ -87,6 +87,35 @@ class RosettePlottingTests(unittest.TestCase):
 
         np.testing.assert_allclose(smoothed, [1.0, 1.5, 2.0, 3.0])
 
+    def test_moving_average_is_applied_before_decimation(self):
+        harness = RosettePlottingHarness()
+        spec = harness.get_rosette_display_channel_specs()[0]
+        rng = np.random.default_rng(7)
+        samples = 1000.0 + rng.normal(0.0, 25.0, size=5000)
+        data = samples.astype(np.float32).reshape(-1, 1)
+        timestamps = np.arange(len(data), dtype=np.float64)
+
+        channel_data, channel_times, _latest_value = harness._prepare_channel_plot_series(
+            spec,
+            data,
+            timestamps,
+            avg_sample_time_sec=0.0,
+            max_samples_per_series=400,
+            display_settings={
+                "is_555": False,
+                "voltage_gain": 1.0,
+                "subtract_baseline": False,
+                "adc_polarity": 1.0,
+            },
+            moving_average_window=10,
+        )
+
+        reference = ADCPlottingMixin._apply_trailing_moving_average(data[:, 0], 10)
+        self.assertLessEqual(len(channel_data), 400)
+        np.testing.assert_allclose(channel_data, reference[channel_times.astype(np.intp)])
+        self.assertAlmostEqual(channel_data.max(), reference.max())
+        self.assertAlmostEqual(channel_data.min(), reference.min())
+
     def test_rosette_baseline_uses_latest_samples_per_channel(self):
         harness = RosettePlottingHarness()
 
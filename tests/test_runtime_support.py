@@ -1,42 +1,16 @@
 import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from PyQt6.QtWidgets import QApplication, QGraphicsItem, QTextEdit
 
 from config.config_handlers import ConfigurationMixin
 from constants.ui import MAX_LOG_LINES
 from data_processing.adc_plotting import ADCPlottingMixin
+from gui.file_panels import FilePanelsMixin
 from gui.status_logging import StatusLoggingMixin
 
 
-class FakeScrollBar:
-    def __init__(self):
-        self.value = None
-
-    def setValue(self, value):
-        self.value = value
-
-    def maximum(self):
-        return 999
-
-
-class FakeStatusText:
-    def __init__(self):
-        self._text = ''
-        self._scrollbar = FakeScrollBar()
-
-    def append(self, text):
-        if self._text:
-            self._text += '\n'
-        self._text += text
-
-    def toPlainText(self):
-        return self._text
-
-    def setPlainText(self, text):
-        self._text = text
-
-    def verticalScrollBar(self):
-        return self._scrollbar
-
-
 class FakeComboBox:
     def __init__(self, text):
         self._text = text
@@ -57,9 +31,42 @@ class FakePlotWidget:
         self.auto_range_axis = axis
 
 
+class FakeCurve:
+    def __init__(self):
+        self.visible = False
+        self.pen = None
+        self.data_kwargs = None
+
+    def setVisible(self, visible):
+        self.visible = visible
+
+    def setPen(self, pen):
+        self.pen = pen
+
+    def setData(self, **kwargs):
+        self.data_kwargs = kwargs
+
+
+class FakeTimer:
+    def __init__(self):
+        self.active = False
+        self.start_count = 0
+
+    def isActive(self):
+        return self.active
+
+    def start(self):
+        self.active = True
+        self.start_count += 1
+
+
 class StatusLoggingHarness(StatusLoggingMixin):
     def __init__(self):
-        self.status_text = FakeStatusText()
+        self.status_text = QTextEdit()
+
+
+class StatusPanelHarness(FilePanelsMixin, StatusLoggingMixin):
+    pass
 
 
 class ConfigurationHarness(ConfigurationMixin):
@@ -77,6 +84,11 @@ class ADCPlottingHarness(ADCPlottingMixin, ConfigurationHarness):
 
 
 class RuntimeSupportTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Keep the reference: a garbage-collected QApplication crashes Qt.
+        cls.app = QApplication.instance() or QApplication([])
+
     def test_get_vref_voltage_maps_known_references(self):
         self.assertEqual(ConfigurationHarness('1.2').get_vref_voltage(), 1.2)
         self.assertEqual(ConfigurationHarness('vdd').get_vref_voltage(), 3.3)
@@ -85,7 +97,9 @@ class RuntimeSupportTests(unittest.TestCase):
         self.assertEqual(ConfigurationHarness('unknown').get_vref_voltage(), 3.3)
 
     def test_log_status_trims_to_max_lines_and_scrolls(self):
-        harness = StatusLoggingHarness()
+        harness = StatusPanelHarness()
+        # The group box owns status_text; keep it alive for the test.
+        harness.status_group = harness.create_status_section()
         existing = '\n'.join(f'line {i}' for i in range(MAX_LOG_LINES))
         harness.status_text.setPlainText(existing)
 
@@ -93,8 +107,47 @@ class RuntimeSupportTests(unittest.TestCase):
 
         lines = harness.status_text.toPlainText().split('\n')
         self.assertEqual(len(lines), MAX_LOG_LINES)
+        self.assertEqual(lines[0], 'line 1')
         self.assertTrue(lines[-1].endswith('new message'))
-        self.assertEqual(harness.status_text.verticalScrollBar().value, 999)
+        scrollbar = harness.status_text.verticalScrollBar()
+        self.assertEqual(scrollbar.value(), scrollbar.maximum())
+
+    def test_status_timestamp_matches_wall_clock_format(self):
+        harness = StatusLoggingHarness()
+        with patch('gui.status_logging.time.time', return_value=datetime(2024, 5, 6, 7, 8, 9, 123456).timestamp()):
+            first = harness._status_timestamp()
+            second = harness._status_timestamp()
+
+        self.assertEqual(first, '07:08:09.123')
+        self.assertEqual(second, first)
+
+    def test_log_status_batches_lines_until_flush(self):
+        harness = StatusLoggingHarness()
+        harness.status_log_flush_timer = FakeTimer()
+
+        harness.log_status('first')
+        harness.log_status('second')
+
+        self.assertEqual(harness.status_text.toPlainText(), '')
+        self.assertEqual(harness.status_log_flush_timer.start_count, 1)
+
+        harness.flush_status_log()
+
+        lines = harness.status_text.toPlainText().split('\n')
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith('first'))
+        self.assertTrue(lines[1].endswith('second'))
+
+    def test_flush_status_log_keeps_html_like_messages_as_plain_lines(self):
+        harness = StatusLoggingHarness()
+
+        harness.log_status('<b>bold</b>')
+        harness.log_status('next')
+
+        lines = harness.status_text.toPlainText().split('\n')
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].endswith('<b>bold</b>'))
+        self.assertTrue(lines[1].endswith('next'))
 
     def test_apply_y_axis_range_uses_configuration_voltage(self):
         harness = ADCPlottingHarness(reference='ext', range_text='Full-Scale', units_text='Voltage')
@@ -103,6 +156,40 @@ class RuntimeSupportTests(unittest.TestCase):
 
         self.assertEqual(harness.plot_widget.y_range, (0, 1.25, 0.02))
 
+    def test_set_adc_curve_data_skips_pyqtgraph_finite_scan(self):
+        harness = ADCPlottingHarness()
+        curve = FakeCurve()
+        harness._adc_curves = {'ch0': curve}
+
+        harness._set_adc_curve_data('ch0', 'Ch 0', 'pen', [0.0, 1.0], [2.0, 3.0])
+
+        self.assertTrue(curve.visible)
+        self.assertEqual(curve.pen, 'pen')
+        self.assertEqual(curve.data_kwargs['y'], [2.0, 3.0])
+        self.assertTrue(curve.data_kwargs['skipFiniteCheck'])
+
+    def test_configured_curves_cache_their_rendering_in_device_pixels(self):
+        class FakeGraphicsCurve:
+            cache_mode = None
+
+            def setCacheMode(self, mode):
+                self.cache_mode = mode
+
+        class FakeDataItem:
+            def __init__(self):
+                self.curve = FakeGraphicsCurve()
+
+            def setDownsampling(self, **kwargs):
+                pass
+
+            def setClipToView(self, clip):
+                pass
+
+        item = FakeDataItem()
+        ADCPlottingMixin._configure_curve_rendering(item)
+
+        self.assertEqual(item.curve.cache_mode, QGraphicsItem.CacheMode.DeviceCoordinateCache)
+
 
 if __name__ == '__main__':
     unittest.main()
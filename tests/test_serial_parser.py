@@ -38,6 +38,14 @@ class SerialStatusParserTests(unittest.TestCase):
         self.parser.parse_status_line("#   1,2,3,4,5")
         self.assertEqual(self.parser.arduino_status.channels, [1, 2, 3, 4, 5])
 
+    def test_process_serial_data_logs_every_status_line_and_parses_fields(self):
+        for line in ("# STATUS", "#   1,2,3", "# osr: 8", "# ready"):
+            self.parser.process_serial_data(line)
+
+        self.assertEqual(self.parser.logged, ["# STATUS", "#   1,2,3", "# osr: 8", "# ready"])
+        self.assertEqual(self.parser.arduino_status.channels, [1, 2, 3])
+        self.assertEqual(self.parser.arduino_status.osr, 8)
+
     def test_parses_scalar_fields(self):
         self.parser.parse_status_line("# repeatCount: 4")
         self.parser.parse_status_line("# groundPin: 7")
@@ -87,6 +95,16 @@ class SerialStatusParserTests(unittest.TestCase):
         self.parser.parse_status_line("#   4,bad,6")
         self.assertEqual(self.parser.arduino_status.channels, [1, 2, 3])
 
+    def test_parses_firmware_keys_with_annotations(self):
+        self.parser.parse_status_line("# repeatCount (samples per channel): 3")
+        self.parser.parse_status_line("# osr (high-speed): 4")
+        self.parser.parse_status_line("# reference: VDD")
+
+        status = self.parser.arduino_status
+        self.assertEqual(status.repeat, 3)
+        self.assertEqual(status.osr, 4)
+        self.assertEqual(status.reference, "vdd")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,9 +21,7 @@ class SerialReaderThreadTests(unittest.TestCase):
 
         accepted_packets = []
         rejection_messages = []
-        reader.binary_sweep_received.connect(
-            lambda samples, avg_us, start_us, end_us: accepted_packets.append((samples, avg_us, start_us, end_us))
-        )
+        reader.binary_blocks_received.connect(accepted_packets.extend)
         reader.error_occurred.connect(lambda message: rejection_messages.append(str(message)))
 
         # False header with huge sample_count that should now be rejected quickly.
@@ -50,9 +48,7 @@ class SerialReaderThreadTests(unittest.TestCase):
 
         accepted_packets = []
         rejection_messages = []
-        reader.binary_sweep_received.connect(
-            lambda samples, avg_us, start_us, end_us: accepted_packets.append((samples, avg_us, start_us, end_us))
-        )
+        reader.binary_blocks_received.connect(accepted_packets.extend)
         reader.error_occurred.connect(lambda message: rejection_messages.append(str(message)))
 
         valid_samples = list(range(20))
@@ -71,6 +67,111 @@ class SerialReaderThreadTests(unittest.TestCase):
         self.assertEqual(len(remaining), 0)
         self.assertTrue(any("timing sanity check failed" in message for message in rejection_messages))
 
+    def test_noise_before_packet_is_skipped_and_packet_parsed(self):
+        reader = SerialReaderThread(serial_port=None)
+        reader.set_capturing(True, expected_samples_per_sweep=20)
+
+        accepted_packets = []
+        reader.binary_blocks_received.connect(
+            lambda blocks: accepted_packets.extend(block[0] for block in blocks)
+        )
+
+        samples = list(range(20))
+        noise = bytes(range(0x00, 0x23)) + b"\x55\x10" * 50
+        remaining = reader.process_binary_data(bytearray(noise + self._build_packet(samples)))
+
+        self.assertEqual(len(accepted_packets), 1)
+        np.testing.assert_array_equal(accepted_packets[0], np.asarray(samples, dtype=np.uint16))
+        self.assertEqual(len(remaining), 0)
+
+    def test_packets_from_one_read_are_emitted_together(self):
+        reader = SerialReaderThread(serial_port=None)
+        reader.set_capturing(True, expected_samples_per_sweep=20)
+
+        emissions = []
+        reader.binary_blocks_received.connect(emissions.append)
+
+        first = self._build_packet(list(range(20)), block_start_us=1000, block_end_us=2220)
+        second = self._build_packet(list(range(20, 40)), block_start_us=3000, block_end_us=4220)
+        reader.process_binary_data(bytearray(first + second))
+
+        self.assertEqual(len(emissions), 1)
+        self.assertEqual([block[2] for block in emissions[0]], [1000, 3000])
+
+        reader.process_binary_data(bytearray(b"\x01\x02"))
+        self.assertEqual(len(emissions), 1)
+
+    def test_ascii_line_between_packets_keeps_wire_order(self):
+        reader = SerialReaderThread(serial_port=None)
+        reader.set_capturing(True, expected_samples_per_sweep=20)
+
+        events = []
+        reader.binary_blocks_received.connect(
+            lambda blocks: events.append(("blocks", [block[2] for block in blocks]))
+        )
+        reader.data_received.connect(lambda line: events.append(("line", str(line))))
+
+        first = self._build_packet(list(range(20)), block_start_us=1000, block_end_us=2220)
+        second = self._build_packet(list(range(20)), block_start_us=3000, block_end_us=4220)
+        reader.process_binary_data(bytearray(first + b"#STATUS ok\n" + second))
+
+        self.assertEqual(
+            events,
+            [("blocks", [1000]), ("line", "#STATUS ok"), ("blocks", [3000])],
+        )
+
+    def test_trailing_sync_byte_is_kept_for_next_read(self):
+        reader = SerialReaderThread(serial_port=None)
+
+        remaining = reader.process_binary_data(bytearray(b"\x01\x02\x03\xAA"))
+
+        self.assertEqual(bytes(remaining), b"\xAA")
+
+
+class _ScriptedPort:
+    """Serial port stand-in that serves queued chunks through read()/in_waiting."""
+
+    def __init__(self, chunks, on_exhausted):
+        self.is_open = True
+        self._pending = bytearray()
+        self._chunks = list(chunks)
+        self._on_exhausted = on_exhausted
+        self.read_sizes = []
+        self.cancel_calls = 0
+
+    @property
+    def in_waiting(self):
+        return len(self._pending)
+
+    def read(self, size=1):
+        self.read_sizes.append(size)
+        if not self._pending:
+            if not self._chunks:
+                self._on_exhausted()
+                return b""
+            self._pending.extend(self._chunks.pop(0))
+        data = bytes(self._pending[:size])
+        del self._pending[:size]
+        return data
+
+    def cancel_read(self):
+        self.cancel_calls += 1
+
+
+class SerialReaderRunLoopTests(unittest.TestCase):
+    def test_run_blocks_for_first_byte_then_drains_waiting_bytes(self):
+        reader = SerialReaderThread(serial_port=None)
+        port = _ScriptedPort([b"#OK\n#DONE\n"], on_exhausted=reader.stop)
+        reader.serial_port = port
+        lines = []
+        reader.data_received.connect(lambda line: lines.append(str(line)))
+
+        reader.run()
+
+        self.assertEqual(lines, ["#OK", "#DONE"])
+        self.assertEqual(port.read_sizes, [1, 9, 1])
+        self.assertEqual(port.cancel_calls, 1)
+
 
 class SerialReaderAsciiLineTests(unittest.TestCase):
     def _make_reader(self):
@@ -115,8 +216,8 @@ class SerialReaderAsciiLineTests(unittest.TestCase):
         reader.set_capturing(True, expected_samples_per_sweep=20)
 
         accepted = []
-        reader.binary_sweep_received.connect(
-            lambda samples, avg_us, start_us, end_us: accepted.append(samples)
+        reader.binary_blocks_received.connect(
+            lambda blocks: accepted.extend(block[0] for block in blocks)
         )
 
         samples = list(range(20))
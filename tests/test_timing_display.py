@@ -2,6 +2,7 @@
 
 import numpy as np
 
+from constants.runtime import MAX_TIMING_SAMPLES
 from data_processing.timing_display import TimingDisplayMixin
 
 
@@ -91,6 +92,18 @@ class TimingDisplayTests(unittest.TestCase):
         self.assertEqual(harness._format_time_auto(0.05), '50.00 ms')
         self.assertEqual(harness._format_time_auto(1.25), '1.2500 s')
 
+    def test_timing_histories_keep_only_recent_samples(self):
+        harness = TimingHarness()
+        history = harness.timing_state.arduino_sample_times
+
+        for value in range(MAX_TIMING_SAMPLES + 25):
+            history.append(float(value))
+
+        self.assertIs(harness.timing_state.arduino_sample_times, history)
+        self.assertEqual(len(history), MAX_TIMING_SAMPLES)
+        self.assertEqual(history[0], 25.0)
+        self.assertEqual(history[-1], float(MAX_TIMING_SAMPLES + 24))
+
     def test_update_555_timing_readouts_formats_charge_and_discharge(self):
         harness = TimingHarness()
 